@@ -0,0 +1,55 @@
+"""
+Angle -> tick kernel for the arm's per-command hot path.
+
+Looks up PCA9685 off-ticks for several joints at once from one packed table
+of every servo's lookup table (Servo.build_lut), one row per joint, padded
+with each row's last entry so no per-joint length is needed. JIT-compiled
+with Numba when it is installed; otherwise an equivalent NumPy version is used.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def pack_luts(luts: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack per-servo LUTs into one (n_joints, max_len) uint16 table, edge-padded."""
+    width = max(len(lut) for lut in luts)
+    table = np.empty((len(luts), width), dtype=np.uint16)
+    for j, lut in enumerate(luts):
+        table[j, :len(lut)] = lut
+        table[j, len(lut):] = lut[-1]
+    return table
+
+
+def _joint_ticks_numpy(joints, angles, table, lut_min, lut_scale, out):
+    idx = ((angles - lut_min[joints]) * lut_scale[joints] + 0.5).astype(np.intp)
+    np.clip(idx, 0, table.shape[1] - 1, out=idx)
+    out[:len(joints)] = table[joints, idx]
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def joint_ticks(joints, angles, table, lut_min, lut_scale, out):
+        """out[k] = off-ticks for joint joints[k] at (already clamped) angles[k]."""
+        last = table.shape[1] - 1
+        for k in range(joints.shape[0]):
+            j = joints[k]
+            idx = int((angles[k] - lut_min[j]) * lut_scale[j] + 0.5)
+            if idx < 0:
+                idx = 0
+            elif idx > last:
+                idx = last
+            out[k] = table[j, idx]
+
+else:
+    joint_ticks = _joint_ticks_numpy
@@ -0,0 +1,129 @@
+"""
+Minimal Linux I2C bus for the PCA9685 hot path.
+
+Talks to /dev/i2c-N with a single I2C_RDWR ioctl per transfer. The message
+structs and the data buffer are allocated once per bus and filled in place,
+so a channel update costs one syscall and no Python-side allocations beyond
+the ioctl call itself (smbus2 builds a new i2c_msg + buffer per write).
+
+Only what PCA9685 needs is implemented: raw writes, and byte register
+read/write for chip setup.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+from typing import Sequence
+
+try:
+    import fcntl
+    FAST_I2C_AVAILABLE = True
+except ImportError:  # not Linux
+    FAST_I2C_AVAILABLE = False
+
+# linux/i2c-dev.h, linux/i2c.h
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+
+# Register pointer + all 16 PCA9685 channels (4 bytes each)
+MAX_WRITE_LEN = 1 + 16 * 4
+# Messages per combined write: 16 channels split into runs by gaps gives at most 8
+MAX_WRITE_MSGS = 8
+
+
+class _I2CMsg(ctypes.Structure):
+    _fields_ = [
+        ("addr", ctypes.c_uint16),
+        ("flags", ctypes.c_uint16),
+        ("len", ctypes.c_uint16),
+        ("buf", ctypes.POINTER(ctypes.c_uint8)),
+    ]
+
+
+class _I2CRdwrData(ctypes.Structure):
+    _fields_ = [
+        ("msgs", ctypes.POINTER(_I2CMsg)),
+        ("nmsgs", ctypes.c_uint32),
+    ]
+
+
+class I2CBus:
+    """
+    /dev/i2c-N opened once; writes reuse preallocated ioctl structures.
+
+    Not thread-safe: the buffers are shared, so use one bus per thread.
+    """
+
+    def __init__(self, bus_num: int):
+        if not FAST_I2C_AVAILABLE:
+            raise OSError("I2C_RDWR ioctl not available on this platform")
+
+        self.fd = os.open(f"/dev/i2c-{int(bus_num)}", os.O_RDWR)
+
+        self._wbuf = (ctypes.c_uint8 * MAX_WRITE_LEN)()
+        self._rbuf = (ctypes.c_uint8 * 1)()
+        self._msgs = (_I2CMsg * 2)()
+        self._msgs[0].buf = self._wbuf
+        self._msgs[1].flags = I2C_M_RD
+        self._msgs[1].len = 1
+        self._msgs[1].buf = self._rbuf
+        self._rdwr = _I2CRdwrData(self._msgs, 1)
+
+        # Separate buffers for write_many(), so each message keeps its own data
+        self._mbufs = [(ctypes.c_uint8 * MAX_WRITE_LEN)() for _ in range(MAX_WRITE_MSGS)]
+        self._mmsgs = (_I2CMsg * MAX_WRITE_MSGS)()
+        for msg, buf in zip(self._mmsgs, self._mbufs):
+            msg.buf = buf
+        self._mrdwr = _I2CRdwrData(self._mmsgs, 0)
+
+    def write(self, addr: int, data: Sequence[int]) -> None:
+        """One I2C write transaction of `data` (register pointer first) to `addr`."""
+        n = len(data)
+        if n > MAX_WRITE_LEN:
+            raise ValueError(f"I2C write too long: {n} > {MAX_WRITE_LEN} bytes")
+        self._wbuf[:n] = data
+        msg = self._msgs[0]
+        msg.addr = addr
+        msg.flags = 0
+        msg.len = n
+        self._rdwr.nmsgs = 1
+        fcntl.ioctl(self.fd, I2C_RDWR, self._rdwr)
+
+    def write_many(self, addr: int, payloads: Sequence[Sequence[int]]) -> None:
+        """
+        Several writes to `addr` in one I2C_RDWR ioctl (repeated START between
+        them, one STOP at the end), using the preallocated message buffers.
+        """
+        n = len(payloads)
+        if n > MAX_WRITE_MSGS:
+            raise ValueError(f"Too many I2C messages: {n} > {MAX_WRITE_MSGS}")
+        for msg, buf, data in zip(self._mmsgs, self._mbufs, payloads):
+            size = len(data)
+            if size > MAX_WRITE_LEN:
+                raise ValueError(f"I2C write too long: {size} > {MAX_WRITE_LEN} bytes")
+            buf[:size] = data
+            msg.addr = addr
+            msg.flags = 0
+            msg.len = size
+        self._mrdwr.nmsgs = n
+        fcntl.ioctl(self.fd, I2C_RDWR, self._mrdwr)
+
+    def write_byte_data(self, addr: int, register: int, value: int) -> None:
+        self.write(addr, (register & 0xFF, value & 0xFF))
+
+    def read_byte_data(self, addr: int, register: int) -> int:
+        """Write the register pointer, then read one byte (repeated start)."""
+        self._wbuf[0] = register & 0xFF
+        self._msgs[0].addr = addr
+        self._msgs[0].flags = 0
+        self._msgs[0].len = 1
+        self._msgs[1].addr = addr
+        self._rdwr.nmsgs = 2
+        fcntl.ioctl(self.fd, I2C_RDWR, self._rdwr)
+        return int(self._rbuf[0])
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
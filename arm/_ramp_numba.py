@@ -0,0 +1,44 @@
+"""
+Ramp kernel for coordinated arm moves.
+
+Fills a (n_steps, n_channels) table of PCA9685 tick counts from
+start to end, one row per control tick, along a cubic Hermite curve with zero
+velocity at both ends (smoothstep): servos ease in and out instead of jumping
+to full speed, so a coarser control rate still looks smooth. JIT-compiled with
+Numba when it is installed; otherwise an equivalent NumPy version is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _ramp_ticks_numpy(start_ticks: np.ndarray, end_ticks: np.ndarray, n_steps: int, out: np.ndarray) -> None:
+    frac = np.arange(1, n_steps + 1, dtype=np.float64)[:, None] / n_steps
+    frac = frac * frac * (3.0 - 2.0 * frac)
+    start = start_ticks.astype(np.float64)
+    out[:n_steps] = start + (end_ticks - start) * frac + 0.5
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def ramp_ticks(start_ticks, end_ticks, n_steps, out):
+        """Row i (0-based) holds the ticks at fraction (i + 1) / n_steps of the move."""
+        for i in range(n_steps):
+            frac = (i + 1) / n_steps
+            frac = frac * frac * (3.0 - 2.0 * frac)
+            for j in range(start_ticks.shape[0]):
+                # In float: uint16 - uint16 widens to uint64 and wraps on downward moves
+                s = float(start_ticks[j])
+                out[i, j] = np.uint16(s + (float(end_ticks[j]) - s) * frac + 0.5)
+
+else:
+    ramp_ticks = _ramp_ticks_numpy
+
@@ -0,0 +1,23 @@
+"""
+Deadline waits for motion pacing.
+
+time.sleep() alone wakes up to ~1 ms late on a stock kernel; sleeping short
+of the deadline and spinning the rest lands within a few microseconds.
+"""
+
+from __future__ import annotations
+
+import time
+
+
+def precise_wait(deadline: float, slack: float) -> None:
+    """
+    Wait until `deadline` (time.perf_counter() seconds).
+    Sleeps until `slack` seconds before the deadline, then spins the remainder,
+    trading a little CPU for sub-millisecond wakeup jitter.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > slack:
+        time.sleep(remaining - slack)
+    while time.perf_counter() < deadline:
+        pass
@@ -16,22 +16,72 @@ This version:
 
 from __future__ import annotations
 
+import asyncio
+import ctypes
+import functools
 import json
+import os
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, List, Sequence, Tuple, Union
 
-import yaml
+import numpy as np
 
 from utils.logger import get_logger
 from utils.config_loader import load_config, ConfigLoader
 from arm.pca9685_driver import PCA9685
 from arm.servo import Servo
+from arm._fastpath import joint_ticks, pack_luts
+from arm._ramp_numba import ramp_ticks
+from arm._timing import precise_wait
+from arm.trajectory import hermite_path
+from arm.cmd_ring import SpscRing
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 CALIB_PATH = Path("data/calibration/servo_limits.json")
 
+class Joint(IntEnum):
+    """Fixed joint indices for the structure-of-arrays servo state."""
+
+    SHOULDER = 0
+    ELBOW = 1
+    GRIPPER = 2
+
+
+SERVO_NAMES: Tuple[str, ...] = tuple(j.name.lower() for j in Joint)
+_SERVO_INDEX: Dict[str, int] = {name: i for i, name in enumerate(SERVO_NAMES)}
+
+# Public move targets: {servo name: angle}, or an array indexed by Joint (NaN = skip)
+AngleTargets = Union[Mapping[str, float], np.ndarray]
+
+# Per-joint construction defaults, in Joint order:
+# (name, default PCA9685 channel, default max angle). Elbow's 90° is "fully right".
+_SERVO_SPECS: Tuple[Tuple[str, int, float], ...] = (
+    ("shoulder", 0, 180.0),
+    ("elbow", 1, 90.0),
+    ("gripper", 2, 90.0),
+)
+
+# Fallback for home()/neutral() when poses.yaml doesn't define them
+_ZERO_POSE: Mapping[str, float] = MappingProxyType({"shoulder": 0.0, "elbow": 0.0, "gripper": 0.0})
+
+# mlockall(2) flags (Linux)
+_MCL_CURRENT = 1
+_MCL_FUTURE = 2
+
 
 def _load_servo_calibration(path: Path = CALIB_PATH) -> Dict[str, dict]:
     """Load calibration dict keyed by servo name, or {} if missing/invalid."""
@@ -47,18 +97,210 @@ def _load_servo_calibration(path: Path = CALIB_PATH) -> Dict[str, dict]:
         return {}
 
 
-def _apply_offset_invert(angle: float, offset_deg: float = 0.0, invert: bool = False) -> float:
+_PosesTable = Dict[str, Dict[str, float]]
+
+
+def _clean_poses(data: dict) -> _PosesTable:
+    """
+    Keep dict-valued poses and coerce every angle to float. With msgspec
+    installed the coercion and type checks run in C in one call.
+    """
+    poses = {name: pose for name, pose in data.items() if isinstance(pose, dict)}
+    if MSGSPEC_AVAILABLE:
+        return msgspec.convert(poses, type=_PosesTable, strict=False)
+    return {name: {k: float(v) for k, v in pose.items()} for name, pose in poses.items()}
+
+
+def _read_poses_cache(cache_file: Path, mtime_ns: int, size: int) -> Optional[_PosesTable]:
+    """Poses from the JSON sidecar if it was written for this exact YAML (mtime + size)."""
+    if not cache_file.exists():
+        return None
+    raw = cache_file.read_bytes()
+    data = msgspec.json.decode(raw) if MSGSPEC_AVAILABLE else json.loads(raw)
+    if not isinstance(data, dict) or data.get("mtime_ns") != mtime_ns or data.get("size") != size:
+        return None
+    poses = data["poses"]
+    if MSGSPEC_AVAILABLE:
+        return msgspec.convert(poses, type=_PosesTable)
+    return poses
+
+
+def _write_poses_cache(cache_file: Path, mtime_ns: int, size: int, poses: _PosesTable) -> None:
+    """Write the JSON sidecar atomically so a concurrent reader never sees half a file."""
+    payload = json.dumps({"mtime_ns": mtime_ns, "size": size, "poses": poses}, separators=(",", ":"))
+    tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write poses cache {cache_file}: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_poses_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, Mapping[str, float]]:
     """
-    Apply optional offset/invert from calibration.
-    Note: invert here means: logical angle increases -> physical decreases.
+    Parse a poses YAML file into {pose: {servo: angle}} (read-only).
+
+    Memoized per (path, mtime_ns, size): further ArmControllers in the same
+    process skip disk and parsing, and editing the file changes the key so it
+    is re-read. Across processes the parsed result is cached as JSON next to
+    the YAML, tagged with the mtime/size it was built from and reused only
+    while both still match.
     """
-    a = float(angle) + float(offset_deg)
-    if invert:
-        a = 180.0 - a
-    return a
+    poses_file = Path(path)
+    cache_file = poses_file.with_suffix(".json")
+    try:
+        cleaned = _read_poses_cache(cache_file, mtime_ns, size)
+        if cleaned is not None:
+            logger.info(f"Loaded {len(cleaned)} poses from cache {cache_file}")
+            return MappingProxyType({name: MappingProxyType(pose) for name, pose in cleaned.items()})
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable poses cache {cache_file}: {e}")
+
+    # PyYAML is only imported when the JSON cache is stale. libyaml's C
+    # parser when PyYAML was built against it; pure-Python otherwise.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(poses_file.read_text(encoding="utf-8"), Loader=loader) or {}
+    if not isinstance(data, dict):
+        logger.warning("poses.yaml did not parse to a dict; ignoring")
+        return MappingProxyType({})
+
+    cleaned = _clean_poses(data)
+    logger.info(f"Loaded {len(cleaned)} poses from {poses_file}")
+    _write_poses_cache(cache_file, mtime_ns, size, cleaned)
+
+    return MappingProxyType({name: MappingProxyType(pose) for name, pose in cleaned.items()})
+
+
+# Telemetry blocks created by ArmControllers in this process (names as passed in)
+_OWNED_TELEMETRY: set = set()
+
+
+def attach_angle_telemetry(name: str) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attach to an ArmController's angle telemetry block (arm.telemetry.shm_name)
+    from another process. Returns the block (keep it referenced; close() when
+    done) and a read-only float64 view indexed by Joint. Raises ValueError if
+    the block is too small to be one.
+    """
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        if name not in _OWNED_TELEMETRY:
+            # Older Pythons register attached blocks too and unlink them when this
+            # process exits, which would tear the block down under the controller.
+            # Not for our own block: that would drop the creator's registration and
+            # make its unlink() trip a KeyError in the resource tracker.
+            resource_tracker.unregister(shm._name, "shared_memory")
+    needed = len(SERVO_NAMES) * np.dtype(np.float64).itemsize
+    if shm.size < needed:
+        shm.close()
+        raise ValueError(f"Shared memory '{name}' is {shm.size} bytes; angle telemetry needs {needed}")
+    angles = np.ndarray((len(SERVO_NAMES),), dtype=np.float64, buffer=shm.buf)
+    angles.flags.writeable = False
+    return shm, angles
+
+
+class _ArmCfg:
+    """
+    Read-through view of the config sections ArmController uses. Each value is
+    looked up on first access and then cached on the instance, so repeated
+    reads are plain attribute loads rather than dict walks.
+    """
+
+    def __init__(self, config: ConfigLoader):
+        self._config = config
+
+    def _arm_sub(self, key: str) -> Dict[str, Any]:
+        sec = self.arm.get(key, {}) or {}
+        return sec if isinstance(sec, dict) else {}
+
+    @functools.cached_property
+    def hardware(self) -> Dict[str, Any]:
+        return self._config.get_section("hardware")
+
+    @functools.cached_property
+    def arm(self) -> Dict[str, Any]:
+        return self._config.get_section("arm")
+
+    @functools.cached_property
+    def channels(self) -> Dict[str, int]:
+        return self._arm_sub("servo_channels")
+
+    @functools.cached_property
+    def limits(self) -> Dict[str, dict]:
+        return self._arm_sub("angle_limits")
+
+    @functools.cached_property
+    def pwm_limits(self) -> Dict[str, Any]:
+        return self._arm_sub("pwm_limits")
+
+    @functools.cached_property
+    def movement(self) -> Dict[str, Any]:
+        return self._arm_sub("movement")
+
+    @functools.cached_property
+    def simulate(self) -> Dict[str, Any]:
+        return self._arm_sub("simulate")
+
+    @functools.cached_property
+    def realtime(self) -> Dict[str, Any]:
+        return self._arm_sub("realtime")
+
+    @functools.cached_property
+    def pwm_min(self) -> int:
+        return int(self.pwm_limits.get("min_pulse", 500))
+
+    @functools.cached_property
+    def pwm_max(self) -> int:
+        return int(self.pwm_limits.get("max_pulse", 2500))
+
+
+class _MovePlan(NamedTuple):
+    """A synchronized move computed ahead of time by ArmController._plan."""
+
+    duration: float
+    moves: List[Tuple[int, float]]  # (joint index, clamped servo-space angle)
+    updates: Dict[int, Tuple[int, int]]  # channel -> (on, off) ticks at the target
+    written: List[Tuple[int, float, Tuple[int, int]]]  # state to record once dispatched
+
+
+class CompiledSequence(NamedTuple):
+    """A pose sequence pre-rendered by ArmController.compile_sequence."""
+
+    frames: np.ndarray  # (N, 3) rows of (t_s, channel, off ticks), sorted by t_s
+    final: np.ndarray  # calibrated angle per joint at the end (NaN = never moved)
+    duration: float  # seconds from start to the end of the last pause
+
+
+def _skip_wait(deadline: float, slack: float) -> None:
+    """Stand-in for precise_wait in fast simulation: returns immediately."""
 
 
 class ArmController:
+    # Fixed attribute set: no per-instance __dict__, and attribute loads are slot lookups
+    __slots__ = (
+        "config", "_cfg", "simulate", "pwm", "servos", "poses", "calib",
+        "default_speed", "spinlock_slack_s", "smooth_hz",
+        "current_pose_name", "is_enabled",
+        "_next_deadline", "_sim_fast", "_apply_angles", "_wait_until",
+        "_cal_slope", "_cal_intercept",
+        "_channel_servo",
+        "_servos_tup", "_channels", "_min_angles", "_max_angles",
+        "_targets", "_currents",
+        "_lut_table", "_lut_min", "_lut_scale", "_lut_freq",
+        "_pose_matrix", "_pose_index", "_pose_plans", "_pose_plans_freq",
+        "_ring", "_stream_thread", "_stream_stop",
+        "_angle_shm",
+    )
+
     def __init__(self, config: Optional[ConfigLoader] = None, simulate: bool = False):
         if config is None:
             config = load_config()  # defaults to config/default.yaml in your loader
@@ -66,30 +308,78 @@ class ArmController:
         self.config = config
         self.simulate = bool(simulate)
 
+        # Config sections are fetched once and cached on first use
+        self._cfg = cfg = _ArmCfg(self.config)
+
         # PCA9685 settings (default.yaml)
-        i2c_bus = int(self.config.get("hardware.i2c_bus", 1))
-        i2c_address = int(self.config.get("hardware.i2c_address", 0x40))
-        pwm_freq = int(self.config.get("arm.pwm_frequency", 50))
+        i2c_bus = int(cfg.hardware.get("i2c_bus", 1))
+        i2c_address = int(cfg.hardware.get("i2c_address", 0x40))
+        pwm_freq = int(cfg.arm.get("pwm_frequency", 50))
+        i2c_baudrate = cfg.hardware.get("i2c_baudrate")
 
         logger.info(f"Initializing ArmController (simulate={self.simulate})")
+        t0 = time.perf_counter()
+
+        # Poses don't depend on the hardware: parse them on a worker thread
+        # while the PCA9685 init (I2C writes + oscillator settle) runs here.
+        self.poses: Dict[str, Mapping[str, float]] = {}
+        pool = ThreadPoolExecutor(max_workers=1)
+        poses_future = pool.submit(self._load_poses)
+
         self.pwm = PCA9685(
             i2c_bus=i2c_bus,
             address=i2c_address,
             frequency=pwm_freq,
             simulate=self.simulate,
+            i2c_baudrate=int(i2c_baudrate) if i2c_baudrate else None,
         )
+        logger.debug(f"PCA9685 ready after {(time.perf_counter() - t0) * 1000:.1f} ms")
 
         # Movement settings
-        self.default_speed = float(self.config.get("arm.movement.default_speed", 50))
+        self.default_speed = float(cfg.movement.get("default_speed", 50))
+        self.spinlock_slack_s = float(cfg.movement.get("spinlock_slack_s", 0.0015))
+        self.smooth_hz = max(1.0, float(cfg.movement.get("smooth_steps", 10)))
+
+        # Absolute end time of the last commanded motion/pause (perf_counter);
+        # chaining from it keeps sequences from accumulating sleep drift.
+        self._next_deadline = time.perf_counter()
+
+        # In simulation, skip tick math and motion waits entirely unless
+        # arm.simulate.real_time asks for hardware-like timing.
+        self._sim_fast = self.simulate and not bool(cfg.simulate.get("real_time", False))
+        self._apply_angles = self._apply_targets_sim if self._sim_fast else self._apply_targets
+        self._wait_until = _skip_wait if self._sim_fast else precise_wait
+
+        self._init_servos()
+        self._init_telemetry()
+        logger.debug(f"Servos ready after {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+        poses_future.result()
+        pool.shutdown()
+        logger.debug(f"Poses ready after {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+        self._build_pose_plans()
+
+        self.current_pose_name: Optional[str] = None
+        self.is_enabled: bool = True
+
+        # Streaming command path (start_command_stream); idle until started
+        self._ring: Optional[SpscRing] = None
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_stop = threading.Event()
 
-        # Global PWM limits (fallbacks)
-        global_min_pulse = int(self.config.get("arm.pwm_limits.min_pulse", 500))
-        global_max_pulse = int(self.config.get("arm.pwm_limits.max_pulse", 2500))
+        logger.info(
+            f"ArmController ready: servos={list(self.servos.keys())}, poses={len(self.poses)}, "
+            f"calibration={'FOUND' if self.calib else 'NOT FOUND'}"
+        )
 
-        # Channels + angle limits
-        arm_section = self.config.get_section("arm")
-        channels = arm_section.get("servo_channels", {}) or {}
-        limits = arm_section.get("angle_limits", {}) or {}
+        self._pin_realtime()
+
+    def _init_servos(self) -> None:
+        """Create the shoulder/elbow/gripper servos from config + calibration."""
+        cfg = self._cfg
+        channels = cfg.channels
+        limits = cfg.limits
 
         # Load calibration (if available)
         self.calib = _load_servo_calibration()
@@ -103,214 +393,704 @@ class ArmController:
             Falls back to global pulses if not calibrated.
             """
             c = self.calib.get(name, {})
-            min_p = int(c.get("min_pulse", global_min_pulse))
-            max_p = int(c.get("max_pulse", global_max_pulse))
+            min_p = int(c.get("min_pulse", cfg.pwm_min))
+            max_p = int(c.get("max_pulse", cfg.pwm_max))
             # Optional extras (your calibrator stored these)
             offset = float(c.get("offset_deg", 0.0))
             invert = bool(c.get("invert", False))
             return min_p, max_p, offset, invert
 
-        # Shoulder
-        shoulder_cfg = limits.get("shoulder", {}) or {}
-        sh_min_p, sh_max_p, sh_off, sh_inv = _servo_pulses("shoulder")
-        self._shoulder_offset = sh_off
-        self._shoulder_invert = sh_inv
-
-        self.servos["shoulder"] = Servo(
-            pwm_controller=self.pwm,
-            channel=int(channels.get("shoulder", 0)),
-            name="shoulder",
-            min_angle=float(shoulder_cfg.get("min", 0)),
-            max_angle=float(shoulder_cfg.get("max", 180)),
-            min_pulse=sh_min_p,
-            max_pulse=sh_max_p,
-            home_angle=float(shoulder_cfg.get("home", 0)),
-            neutral_angle=float(shoulder_cfg.get("home", 0)),
-        )
+        offsets: List[float] = []
+        inverts: List[bool] = []
+        for name, default_channel, default_max in _SERVO_SPECS:
+            lim = limits.get(name, {}) or {}
+            min_p, max_p, offset, invert = _servo_pulses(name)
+            offsets.append(offset)
+            inverts.append(invert)
+
+            self.servos[name] = Servo(
+                pwm_controller=self.pwm,
+                channel=int(channels.get(name, default_channel)),
+                name=name,
+                min_angle=float(lim.get("min", 0)),
+                max_angle=float(lim.get("max", default_max)),
+                min_pulse=min_p,
+                max_pulse=max_p,
+                home_angle=float(lim.get("home", 0)),
+                neutral_angle=float(lim.get("home", 0)),
+                spin_slack_s=self.spinlock_slack_s,
+                simulate=self._sim_fast,
+            )
+
+        if not self._sim_fast:
+            for servo in self.servos.values():
+                servo.build_lut(resolution=0.1)
+
+        self._channel_servo: Dict[int, Servo] = {s.channel: s for s in self.servos.values()}
+
+        # Structure-of-arrays view indexed by Joint; self.servos stays as the
+        # name-keyed public view.
+        self._servos_tup: Tuple[Servo, ...] = tuple(self.servos[n] for n in SERVO_NAMES)
+        self._channels = np.array([s.channel for s in self._servos_tup], dtype=np.int64)
+        self._min_angles = np.array([s.min_angle for s in self._servos_tup])
+        self._max_angles = np.array([s.max_angle for s in self._servos_tup])
+        self._targets = np.empty(len(SERVO_NAMES))
+        # Calibration as one affine map per joint, applied to the whole target
+        # vector in _targets_from(): a + offset, or 180 - (a + offset) when
+        # inverted (logical angle up -> physical down).
+        offs = np.array(offsets, dtype=np.float64)
+        inv = np.array(inverts, dtype=bool)
+        self._cal_slope = np.where(inv, -1.0, 1.0)
+        self._cal_intercept = np.where(inv, 180.0 - offs, offs)
+        self._build_lut_table()
+
+        # Last commanded (servo-space) angle per joint; avoids per-move get_angle()
+        # round-trips and always gives move_to_angles a start point to sync from.
+        self._currents = np.array([s.home_angle for s in self._servos_tup])
+
+    def _init_telemetry(self) -> None:
+        """
+        If arm.telemetry.shm_name is set, move the per-joint angle array into a
+        named shared-memory block. Every commanded move already writes there, so
+        other processes can poll angles (attach_angle_telemetry) without calling
+        into this one. Values are servo-space angles in Joint order.
+
+        A block that already exists under that name is reused if it is large
+        enough; it is only unlinked and recreated with arm.telemetry.replace_existing.
+        A name another ArmController in this process publishes to is refused.
+        """
+        self._angle_shm: Optional[shared_memory.SharedMemory] = None
+        telemetry = self._cfg.arm.get("telemetry", {}) or {}
+        name = telemetry.get("shm_name")
+        if not name:
+            return
 
-        # Elbow (your config sets max to 90 for “fully right”)
-        elbow_cfg = limits.get("elbow", {}) or {}
-        el_min_p, el_max_p, el_off, el_inv = _servo_pulses("elbow")
-        self._elbow_offset = el_off
-        self._elbow_invert = el_inv
-
-        self.servos["elbow"] = Servo(
-            pwm_controller=self.pwm,
-            channel=int(channels.get("elbow", 1)),
-            name="elbow",
-            min_angle=float(elbow_cfg.get("min", 0)),
-            max_angle=float(elbow_cfg.get("max", 90)),
-            min_pulse=el_min_p,
-            max_pulse=el_max_p,
-            home_angle=float(elbow_cfg.get("home", 0)),
-            neutral_angle=float(elbow_cfg.get("home", 0)),
-        )
+        if name in _OWNED_TELEMETRY:
+            logger.warning(f"Angle telemetry disabled: '{name}' is already published by another ArmController")
+            return
 
-        # Gripper
-        gripper_cfg = limits.get("gripper", {}) or {}
-        gr_min_p, gr_max_p, gr_off, gr_inv = _servo_pulses("gripper")
-        self._gripper_offset = gr_off
-        self._gripper_invert = gr_inv
-
-        self.servos["gripper"] = Servo(
-            pwm_controller=self.pwm,
-            channel=int(channels.get("gripper", 2)),
-            name="gripper",
-            min_angle=float(gripper_cfg.get("min", 0)),
-            max_angle=float(gripper_cfg.get("max", 90)),
-            min_pulse=gr_min_p,
-            max_pulse=gr_max_p,
-            home_angle=float(gripper_cfg.get("home", 0)),
-            neutral_angle=float(gripper_cfg.get("home", 0)),
-        )
+        size = self._currents.nbytes
+        replace = bool(telemetry.get("replace_existing", False))
+        try:
+            try:
+                shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            except FileExistsError:
+                # Left over from a run that didn't close cleanly, or still in use by
+                # another process: there is no telling which, so take it over only
+                # if it fits, and unlink it only when explicitly asked to
+                shm = shared_memory.SharedMemory(name=name)
+                if replace:
+                    logger.warning(f"Replacing existing shared memory block '{name}'")
+                    shm.close()
+                    shm.unlink()
+                    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+                elif shm.size < size:
+                    logger.warning(
+                        f"Angle telemetry disabled: existing shared memory block '{name}' is "
+                        f"{shm.size} bytes, need {size} (set arm.telemetry.replace_existing to replace it)"
+                    )
+                    # Attaching registered it with our resource tracker, which would
+                    # unlink it at exit: it isn't ours to remove
+                    resource_tracker.unregister(shm._name, "shared_memory")
+                    shm.close()
+                    return
+                else:
+                    logger.warning(f"Reusing existing shared memory block '{name}'")
+        except OSError as e:
+            logger.warning(f"Angle telemetry disabled: {e}")
+            return
 
-        # Poses
-        self.poses: Dict[str, Dict[str, float]] = {}
-        self._load_poses()
+        shared = np.ndarray(self._currents.shape, dtype=self._currents.dtype, buffer=shm.buf)
+        shared[:] = self._currents
+        self._currents = shared
+        self._angle_shm = shm
+        _OWNED_TELEMETRY.add(name)
+        logger.info(f"Publishing joint angles to shared memory '{name}'")
 
-        self.current_pose_name: Optional[str] = None
-        self.is_enabled: bool = True
+    def _close_telemetry(self) -> None:
+        shm = self._angle_shm
+        if shm is None:
+            return
+        # Detach the array from the block before releasing it
+        self._currents = np.array(self._currents)
+        self._angle_shm = None
+        _OWNED_TELEMETRY.discard(shm.name)
+        shm.close()
+        shm.unlink()
+
+    def _pin_realtime(self) -> None:
+        """
+        Optionally pin the arm-control thread to one CPU with SCHED_FIFO and lock
+        memory, so move timing is not at the mercy of the CFS scheduler or page faults.
 
-        logger.info(
-            f"ArmController ready: servos={list(self.servos.keys())}, poses={len(self.poses)}, "
-            f"calibration={'FOUND' if self.calib else 'NOT FOUND'}"
-        )
+        Enabled by arm.realtime.enabled. Applies to the calling thread (threads it
+        starts afterwards inherit it). For best results the CPU should also be in
+        the kernel's isolcpus= list. Failures (no root / not Linux) only warn.
+        """
+        rt = self._cfg.realtime
+        if self.simulate or not rt.get("enabled", False):
+            return
+
+        cpu = rt.get("cpu")
+        cpu = int(cpu) if cpu is not None else (os.cpu_count() or 1) - 1
+        priority = int(rt.get("priority", 50))
+
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("Realtime pinning not supported on this platform")
+            return
+
+        try:
+            os.sched_setaffinity(0, {cpu})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            logger.info(f"Arm control pinned to CPU {cpu} (SCHED_FIFO prio {priority})")
+        except (PermissionError, OSError) as e:
+            logger.warning(f"Could not set realtime scheduling (cpu={cpu}, prio={priority}): {e}")
+
+        try:
+            libc = ctypes.CDLL("libc.so.6", use_errno=True)
+            if libc.mlockall(_MCL_CURRENT | _MCL_FUTURE) != 0:
+                logger.warning(f"mlockall failed: {os.strerror(ctypes.get_errno())}")
+        except OSError as e:
+            logger.warning(f"mlockall unavailable: {e}")
 
     def _load_poses(self) -> None:
-        """Load poses from arm/poses.yaml relative to this file."""
+        """Load poses from arm/poses.yaml relative to this file (read-only mappings)."""
         poses_file = Path(__file__).with_name("poses.yaml")
         if not poses_file.exists():
             logger.warning(f"Poses file not found: {poses_file}")
             return
 
         try:
-            data = yaml.safe_load(poses_file.read_text(encoding="utf-8")) or {}
-            if not isinstance(data, dict):
-                logger.warning("poses.yaml did not parse to a dict; ignoring")
-                return
-
-            cleaned: Dict[str, Dict[str, float]] = {}
-            for pose_name, pose in data.items():
-                if isinstance(pose, dict):
-                    cleaned[pose_name] = {k: float(v) for k, v in pose.items()}
-            self.poses = cleaned
-            logger.info(f"Loaded {len(self.poses)} poses from {poses_file}")
+            st = poses_file.stat()
+            poses = _parse_poses_cached(str(poses_file), st.st_mtime_ns, st.st_size)
         except Exception as e:
             logger.error(f"Error loading poses: {e}")
+            return
+        # Own outer dict per controller; the per-pose proxies are shared and immutable
+        self.poses = dict(poses)
+
+    def _build_pose_plans(self) -> None:
+        """
+        Precompute every pose's calibrated, clamped servo angles as one row of
+        _pose_matrix (fixed servo order; NaN = joint not in the pose; row number
+        in _pose_index), and a zero-duration _MovePlan holding its ready-to-send
+        {channel: (on, off)} writes, so go_to_pose_fast does no per-call angle or
+        tick math at all.
+        """
+        names = list(self.poses)
+        poses = list(self.poses.values())
+        unknown = set().union(*poses) - _SERVO_INDEX.keys() if poses else set()
+        for servo_name in sorted(unknown):
+            logger.warning("Unknown servo: %s", servo_name)
+
+        # One C-level conversion per joint column rather than a float() per angle
+        raw = np.empty((len(names), len(SERVO_NAMES)))
+        for idx, servo_name in enumerate(SERVO_NAMES):
+            raw[:, idx] = np.fromiter((p.get(servo_name, np.nan) for p in poses), dtype=np.float64, count=len(poses))
+
+        # Calibrate and clamp every pose at once (NaN passes through both)
+        raw *= self._cal_slope
+        raw += self._cal_intercept
+        matrix = np.clip(raw, self._min_angles, self._max_angles)
+        matrix.flags.writeable = False
+        clamped = [names[row] for row in np.flatnonzero((np.abs(matrix - raw) > 0).any(axis=1))]
+
+        self._pose_matrix = matrix
+        self._pose_index: Dict[str, int] = {name: row for row, name in enumerate(names)}
+        self._pose_plans: Dict[str, _MovePlan] = {}
+        for name, targets in zip(names, matrix):
+            moves = self._moves(targets)
+            updates, written = self._prepare_targets(moves, validate=False)
+            self._pose_plans[name] = _MovePlan(0.0, moves, updates, written)
+        self._pose_plans_freq = self.pwm.frequency
+        # One summary warning instead of one per joint per move
+        if clamped:
+            logger.warning(f"{len(clamped)} poses exceed servo angle limits and will be clamped: {', '.join(clamped)}")
 
     def get_servo(self, name: str) -> Optional[Servo]:
         return self.servos.get(name)
 
     def get_current_angles(self) -> Dict[str, Optional[float]]:
-        return {name: servo.get_angle() for name, servo in self.servos.items()}
+        return {SERVO_NAMES[i]: servo.get_angle() for i, servo in enumerate(self._servos_tup)}
+
+    def resync(self) -> None:
+        """Refresh the cached angles from the servos (e.g. after driving them directly)."""
+        for i, servo in enumerate(self._servos_tup):
+            angle = servo.get_angle()
+            if angle is not None:
+                self._currents[i] = angle
 
     # ---------------- Core movement ----------------
 
-    def set_angles(self, angles: Dict[str, float], validate: bool = True) -> bool:
+    def _write_channels(self, updates: Dict[int, Tuple[int, int]]) -> None:
+        """
+        Push {channel: (on, off)} to the PCA9685 in one I2C transaction.
+
+        Channels are sorted and grouped into contiguous runs. A gap inside a run is
+        filled with the last value written to that channel's servo (so it is not
+        disturbed); gaps with no known value split the run. All runs go out
+        together (one message each) via set_pwm_runs.
+        """
+        if not updates:
+            return
+
+        channels = sorted(updates)
+        runs: List[Tuple[int, List[Tuple[int, int]]]] = []
+        start = channels[0]
+        pairs: List[Tuple[int, int]] = []
+        for ch in range(channels[0], channels[-1] + 1):
+            pwm = updates.get(ch)
+            if pwm is None:
+                servo = self._channel_servo.get(ch)
+                pwm = servo._last_pwm if servo is not None else None
+            if pwm is None:
+                if pairs:
+                    runs.append((start, pairs))
+                start, pairs = ch + 1, []
+                continue
+            pairs.append(pwm)
+        if pairs:
+            runs.append((start, pairs))
+        self.pwm.set_pwm_runs(runs)
+
+    def _build_lut_table(self) -> None:
+        """
+        Pack every servo's angle -> tick LUT into one table for joint_ticks(),
+        or None when the servos have no LUTs (fast simulation).
+        """
+        servos = self._servos_tup
+        if any(s._lut is None for s in servos):
+            self._lut_table = None
+            return
+        self._lut_table = pack_luts([s._lut for s in servos])
+        self._lut_min = np.array([s.min_angle for s in servos])
+        self._lut_scale = np.array([s._lut_scale for s in servos])
+        self._lut_freq = self.pwm.frequency
+
+    def _prepare_targets(
+        self, moves: List[Tuple[int, float]], validate: bool = True
+    ) -> Tuple[Dict[int, Tuple[int, int]], List[Tuple[int, float, Tuple[int, int]]]]:
+        """Compute {channel: (on, off)} for (joint index, angle) pairs without any I/O."""
+        updates: Dict[int, Tuple[int, int]] = {}
+        written: List[Tuple[int, float, Tuple[int, int]]] = []
+        servos = self._servos_tup
+        if validate:
+            moves = [(i, servos[i]._clamp_angle(angle)) for i, angle in moves]
+
+        if self._lut_table is not None and moves:
+            if self._lut_freq != self.pwm.frequency:
+                for servo in servos:
+                    servo.build_lut(1.0 / servo._lut_scale)
+                self._build_lut_table()
+            # One kernel call for every joint instead of a compute_pulse() per joint
+            n = len(moves)
+            joints = np.fromiter((i for i, _ in moves), dtype=np.intp, count=n)
+            angles = np.fromiter((a for _, a in moves), dtype=np.float64, count=n)
+            ticks = np.empty(n, dtype=np.uint16)
+            joint_ticks(joints, angles, self._lut_table, self._lut_min, self._lut_scale, ticks)
+            for (i, a), t in zip(moves, ticks.tolist()):
+                pwm = (0, t)
+                updates[servos[i].channel] = pwm
+                written.append((i, a, pwm))
+            return updates, written
+
+        for i, a in moves:
+            servo = servos[i]
+            pwm = servo.compute_pulse(a)
+            updates[servo.channel] = pwm
+            written.append((i, a, pwm))
+        return updates, written
+
+    def _commit_targets(self, written: List[Tuple[int, float, Tuple[int, int]]]) -> None:
+        for i, a, pwm in written:
+            self._servos_tup[i].mark_written(a, pwm)
+            self._currents[i] = a
+
+    def _apply_targets(self, moves: List[Tuple[int, float]], validate: bool = True) -> None:
+        """Compute ticks for (joint index, angle) pairs, write them in one burst, then record state."""
+        updates, written = self._prepare_targets(moves, validate=validate)
+        self._write_channels(updates)
+        self._commit_targets(written)
+
+    def _apply_targets_sim(self, moves: List[Tuple[int, float]], validate: bool = True) -> None:
+        """Simulation stand-in for _apply_targets: record angles, no tick math or I/O."""
+        for i, angle in moves:
+            servo = self._servos_tup[i]
+            servo.set_angle(angle, validate=validate)
+            self._currents[i] = servo._current_angle
+
+    def _run_ramp(self, updates: Dict[int, Tuple[int, int]], start: float, duration: float) -> None:
+        """
+        Drive all channels in `updates` from their last written ticks to the new ones
+        over `duration` seconds, one batched write per control tick (smooth_hz).
+        Channels with no known previous value jump straight to the target.
+        """
+        channels = list(updates)
+        end = np.array([updates[ch][1] for ch in channels], dtype=np.uint16)
+        begin = end.copy()
+        for j, ch in enumerate(channels):
+            last = self._channel_servo[ch]._last_pwm
+            if last is not None and last[1] > 0:
+                begin[j] = last[1]
+
+        n_steps = max(int(duration * self.smooth_hz), 1)
+        rows = np.empty((n_steps, len(channels)), dtype=np.uint16)
+        ramp_ticks(begin, end, n_steps, rows)
+
+        dt = duration / n_steps
+        for i in range(n_steps):
+            # Row i is the position at (i + 1) / n_steps of the move: write it then,
+            # so the target lands at start + duration (and nothing before start)
+            precise_wait(start + (i + 1) * dt, self.spinlock_slack_s)
+            self._write_channels({ch: (0, int(t)) for ch, t in zip(channels, rows[i])})
+
+    def _targets_from(self, angles: AngleTargets) -> Tuple[np.ndarray, bool]:
+        """
+        Calibrated targets in fixed servo order (NaN = joint not commanded).
+
+        `angles` is either {servo name: angle} or an array indexed by Joint
+        (NaN = leave that joint alone). The flag is False if any name was not
+        a known servo.
+        """
+        targets = self._targets
+        targets.fill(np.nan)
+        ok = True
+        if isinstance(angles, np.ndarray):
+            targets[:] = angles
+        else:
+            for name, angle in angles.items():
+                idx = _SERVO_INDEX.get(name)
+                if idx is None:
+                    logger.warning("Unknown servo: %s", name)
+                    ok = False
+                    continue
+                targets[idx] = float(angle)
+
+        # NaN (uncommanded) joints stay NaN
+        targets *= self._cal_slope
+        targets += self._cal_intercept
+        return targets, ok
+
+    def _clip_targets(self, targets: np.ndarray) -> np.ndarray:
+        """Clamp targets to each servo's angle limits in one vector op (NaN passes through)."""
+        clipped = np.clip(targets, self._min_angles, self._max_angles)
+        out_of_range = np.abs(clipped - targets) > 0
+        if out_of_range.any():
+            for i in np.flatnonzero(out_of_range):
+                logger.warning(
+                    f"{SERVO_NAMES[i]}: angle {targets[i]}° outside "
+                    f"{self._min_angles[i]}°-{self._max_angles[i]}°, clamping"
+                )
+        return clipped
+
+    def _moves(self, targets: np.ndarray) -> List[Tuple[int, float]]:
+        """(joint index, angle) for every commanded (non-NaN) joint."""
+        return [(int(i), float(targets[i])) for i in np.flatnonzero(~np.isnan(targets))]
+
+    def set_angles(self, angles: AngleTargets, validate: bool = True) -> bool:
         if not self.is_enabled:
             logger.warning("Arm is disabled; ignoring set_angles")
             return False
 
-        ok = True
-        for name, angle in angles.items():
-            servo = self.servos.get(name)
-            if servo is None:
-                logger.warning(f"Unknown servo: {name}")
-                ok = False
-                continue
-
-            # Apply optional calibration transform
-            if name == "shoulder":
-                angle = _apply_offset_invert(angle, self._shoulder_offset, self._shoulder_invert)
-            elif name == "elbow":
-                angle = _apply_offset_invert(angle, self._elbow_offset, self._elbow_invert)
-            elif name == "gripper":
-                angle = _apply_offset_invert(angle, self._gripper_offset, self._gripper_invert)
+        targets, ok = self._targets_from(angles)
+        if validate:
+            targets = self._clip_targets(targets)
 
-            if not servo.set_angle(float(angle), validate=validate):
-                ok = False
+        self._apply_angles(self._moves(targets), validate=False)
         return ok
 
-    def move_to_angles(self, angles: Dict[str, float], speed: Optional[float] = None, blocking: bool = True) -> bool:
-        if not self.is_enabled:
-            logger.warning("Arm is disabled; ignoring move_to_angles")
-            return False
+    def _plan(self, angles: AngleTargets, speed: Optional[float] = None) -> Optional[_MovePlan]:
+        """
+        Work out a synchronized move (targets, duration, channel ticks) without
+        any I/O. Returns None if no known joint is commanded.
+        """
+        # Plan in fixed servo order; NaN marks joints not being commanded
+        targets, _ = self._targets_from(angles)
+        return self._plan_targets(self._clip_targets(targets), speed)
 
+    def _plan_targets(self, targets: np.ndarray, speed: Optional[float] = None) -> Optional[_MovePlan]:
+        """_plan for targets that are already calibrated and clamped."""
         speed = float(speed) if speed is not None else self.default_speed
-        speed = max(1.0, speed)
+        if speed < 1.0:
+            speed = 1.0
 
-        # Determine max move time for synchronization
-        max_time = 0.0
-        moves: List[Tuple[Servo, str, float, float]] = []  # (servo, name, target, delta)
+        moving = ~np.isnan(targets)
+        if not moving.any():
+            return None
 
-        for name, target in angles.items():
-            servo = self.servos.get(name)
-            if servo is None:
-                logger.warning(f"Unknown servo: {name}")
-                continue
+        # Synchronize: every joint arrives when the largest move finishes
+        max_time = float(np.abs(targets[moving] - self._currents[moving]).max()) / speed
 
-            target = float(target)
+        moves = self._moves(targets)
+        if self._sim_fast:
+            return _MovePlan(max_time, moves, {}, [])
 
-            # Apply optional calibration transform
-            if name == "shoulder":
-                target = _apply_offset_invert(target, self._shoulder_offset, self._shoulder_invert)
-            elif name == "elbow":
-                target = _apply_offset_invert(target, self._elbow_offset, self._elbow_invert)
-            elif name == "gripper":
-                target = _apply_offset_invert(target, self._gripper_offset, self._gripper_invert)
+        updates, written = self._prepare_targets(moves, validate=False)
+        return _MovePlan(max_time, moves, updates, written)
 
-            current = servo.get_angle()
-            if current is None:
-                servo.set_angle(target)
-                continue
+    def _dispatch(self, plan: _MovePlan, ramp: bool = True) -> None:
+        """
+        Issue a planned move and set _next_deadline to its end time. With `ramp`
+        the joints are interpolated tick by tick and this blocks until the last
+        tick is written (the ramp waits for the start deadline first); otherwise
+        the final position is written at once and this returns immediately.
+        """
+        if self._sim_fast:
+            self._apply_targets_sim(plan.moves, validate=False)
+            return
 
-            delta = abs(target - float(current))
-            t = delta / speed if speed > 0 else 0.0
-            max_time = max(max_time, t)
-            moves.append((servo, name, target, delta))
+        start = max(self._next_deadline, time.perf_counter())
+        self._next_deadline = start + plan.duration
+        if ramp and plan.duration > 0:
+            # Interpolate all joints together: one batched write per control tick
+            self._run_ramp(plan.updates, start, plan.duration)
+        else:
+            # All servos start together: one batched write for every channel
+            self._write_channels(plan.updates)
+        self._commit_targets(plan.written)
+
+    def move_to_angles(self, angles: AngleTargets, speed: Optional[float] = None, blocking: bool = True) -> bool:
+        if not self.is_enabled:
+            logger.warning("Arm is disabled; ignoring move_to_angles")
+            return False
 
-        if not moves:
+        return self._execute(self._plan(angles, speed), blocking)
+
+    def _execute(self, plan: Optional[_MovePlan], blocking: bool) -> bool:
+        if plan is None:
             return True
 
-        if max_time <= 0:
-            for servo, _name, target, _delta in moves:
-                servo.set_angle(target)
+        self._dispatch(plan, ramp=blocking)
+        if blocking:
+            self._wait_until(self._next_deadline, self.spinlock_slack_s)
+
+        return True
+
+    def move_trajectory(self, waypoints: Sequence[AngleTargets], duration_s: float) -> bool:
+        """
+        Move through `waypoints` (same forms as move_to_angles) along one cubic
+        Hermite spline per joint, starting and ending at rest, over `duration_s`
+        seconds. Joints a waypoint leaves out hold their previous value; joints no
+        waypoint mentions are not written. Blocks until the path is finished.
+        """
+        if not self.is_enabled:
+            logger.warning("Arm is disabled; ignoring move_trajectory")
+            return False
+        if not waypoints:
             return True
 
+        knots = np.empty((len(waypoints) + 1, len(SERVO_NAMES)))
+        knots[0] = self._currents
+        commanded = np.zeros(len(SERVO_NAMES), dtype=bool)
         ok = True
-        for servo, _name, target, delta in moves:
-            servo_speed = (delta / max_time) if max_time > 0 else speed
-            servo_speed = max(1.0, servo_speed)
-            if not servo.move_to(target, speed=servo_speed, blocking=False):
-                ok = False
+        for k, angles in enumerate(waypoints, 1):
+            targets, known = self._targets_from(angles)
+            ok = ok and known
+            targets = self._clip_targets(targets)
+            given = ~np.isnan(targets)
+            commanded |= given
+            knots[k] = np.where(given, targets, knots[k - 1])
+
+        joints = np.flatnonzero(commanded)
+        if not joints.size:
+            return True  # no known joint named: nothing to move, like move_to_angles
+        final = [(int(i), float(knots[-1, i])) for i in joints]
+        if self._sim_fast:
+            self._apply_targets_sim(final, validate=False)
+            return ok
+
+        duration = max(float(duration_s), 0.0)
+        n_steps = max(int(duration * self.smooth_hz), 1)
+        path = hermite_path(knots[:, joints], n_steps)
+        # Catmull-Rom can overshoot between waypoints; never past the joint limits
+        np.clip(path, self._min_angles[joints], self._max_angles[joints], out=path)
+        channels = [self._servos_tup[i].channel for i in joints]
+        ticks = np.column_stack([self._servos_tup[i].ticks_for(path[:, j]) for j, i in enumerate(joints)])
+
+        start = max(self._next_deadline, time.perf_counter())
+        self._next_deadline = start + duration
+        dt = duration / n_steps
+        for row in range(n_steps):
+            # Row i is the position at (i + 1) / n_steps of the path (see hermite_path)
+            precise_wait(start + (row + 1) * dt, self.spinlock_slack_s)
+            self._write_channels({ch: (0, int(t)) for ch, t in zip(channels, ticks[row])})
+        _, written = self._prepare_targets(final, validate=False)
+        self._commit_targets(written)
+
+        self._wait_until(self._next_deadline, self.spinlock_slack_s)
+        return ok
 
-        if blocking:
-            time.sleep(max_time)
+    def move_to_angles_async(self, angles: AngleTargets, speed: Optional[float] = None) -> "Future[bool]":
+        """
+        Command a move without blocking and return a Future that resolves (True)
+        when the servos are due to arrive, so the caller can plan or sense in the
+        meantime. Like move_to_angles(blocking=False), targets are written at once.
+        """
+        done: Future = Future()
+        if not self.is_enabled:
+            logger.warning("Arm is disabled; ignoring move_to_angles_async")
+            done.set_result(False)
+            return done
+
+        plan = self._plan(angles, speed)
+        if plan is None:
+            done.set_result(True)
+            return done
+
+        self._dispatch(plan, ramp=False)
+        remaining = self._next_deadline - time.perf_counter()
+        if self._sim_fast or remaining <= 0:
+            done.set_result(True)
+        else:
+            timer = threading.Timer(remaining, done.set_result, args=(True,))
+            timer.daemon = True
+            timer.start()
+        return done
+
+    @property
+    def move_deadline(self) -> float:
+        """
+        time.perf_counter() value at which the last commanded move (plus any
+        sequence pause) is due to finish. In the past when the arm is idle.
+        """
+        return self._next_deadline
+
+    def wait_until_done(self, deadline: Optional[float] = None) -> None:
+        """Block until `deadline` (default: move_deadline) has passed."""
+        self._wait_until(self._next_deadline if deadline is None else deadline, self.spinlock_slack_s)
+
+    async def wait_until_done_async(self, deadline: Optional[float] = None) -> None:
+        """asyncio counterpart of wait_until_done(); yields to the event loop."""
+        remaining = (self._next_deadline if deadline is None else deadline) - time.perf_counter()
+        if remaining > 0 and not self._sim_fast:
+            await asyncio.sleep(remaining)
+
+    # ---------------- Command stream ----------------
+
+    def start_command_stream(self, rate_hz: float = 50.0, capacity: int = 64) -> None:
+        """
+        Start a daemon thread that owns the I2C writes for streamed targets.
 
+        Producers call stream_angles() (one producer thread only); every 1/rate_hz
+        the consumer drains the ring and writes the newest target in one batched
+        burst. Don't issue blocking moves from another thread while streaming.
+        """
+        if self._stream_thread is not None:
+            return
+        self._ring = SpscRing(capacity, len(SERVO_NAMES))
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(
+            target=self._stream_loop, args=(1.0 / float(rate_hz),), name="arm-stream", daemon=True
+        )
+        self._stream_thread.start()
+        logger.info(f"Arm command stream started ({rate_hz:g} Hz, {capacity} slots)")
+
+    def stream_angles(self, angles: AngleTargets) -> bool:
+        """
+        Queue a target for the stream thread without touching the bus.
+        Returns False if the stream isn't running, the ring is full, or a name
+        was unknown.
+        """
+        ring = self._ring
+        if ring is None:
+            logger.warning("Command stream not running; ignoring stream_angles")
+            return False
+        targets, ok = self._targets_from(angles)
+        if not ring.push(self._clip_targets(targets)):
+            logger.warning("Command stream full; dropping target")
+            return False
         return ok
 
+    def stop_command_stream(self) -> None:
+        thread = self._stream_thread
+        if thread is None:
+            return
+        self._stream_stop.set()
+        thread.join()
+        self._stream_thread = None
+        self._ring = None
+        logger.info("Arm command stream stopped")
+
+    def _stream_loop(self, period: float) -> None:
+        ring = self._ring
+        vec = np.empty(len(SERVO_NAMES))
+        deadline = time.perf_counter()
+        while not self._stream_stop.is_set():
+            # Targets are absolute, so only the newest one queued matters
+            if ring.pop_latest(vec) and self.is_enabled:
+                self._apply_angles(self._moves(vec), validate=False)
+            deadline += period
+            self._wait_until(deadline, self.spinlock_slack_s)
+            if self._sim_fast:
+                time.sleep(period)
+
     # ---------------- Poses ----------------
 
     def go_to_pose(self, pose_name: str, speed: Optional[float] = None, blocking: bool = True) -> bool:
-        pose = self.poses.get(pose_name)
-        if pose is None:
+        if not self.is_enabled:
+            logger.warning("Arm is disabled; ignoring go_to_pose")
+            return False
+
+        # Pose values are floats already calibrated and clamped at load time,
+        # so skip move_to_angles' name lookup and per-joint coercion
+        targets = self._pose_targets_for(pose_name)
+        if targets is None:
             logger.error(f"Unknown pose: {pose_name}")
             return False
 
-        ok = self.move_to_angles(pose, speed=speed, blocking=blocking)
+        ok = self._execute(self._plan_targets(targets, speed), blocking)
         if ok:
             self.current_pose_name = pose_name
         return ok
 
+    def _pose_targets_for(self, pose_name: str) -> Optional[np.ndarray]:
+        """Calibrated, clamped targets for a pose (precomputed when possible)."""
+        row = self._pose_index.get(pose_name)
+        if row is not None:
+            targets = self._pose_matrix[row]
+        else:
+            pose = self.poses.get(pose_name)
+            if pose is None:
+                return None
+            targets, _ = self._targets_from(pose)
+            targets = self._clip_targets(targets)
+        return targets
+
+    def go_to_pose_fast(self, pose_name: str) -> bool:
+        """
+        Jump straight to a pose using its precomputed ticks: one batched write,
+        no interpolation and no per-call angle math. Does not wait for the servos.
+        """
+        if not self.is_enabled:
+            logger.warning("Arm is disabled; ignoring go_to_pose_fast")
+            return False
+
+        if self._pose_plans_freq != self.pwm.frequency:
+            self._build_pose_plans()
+        plan = self._pose_plans.get(pose_name)
+        if plan is None:
+            logger.error(f"Unknown pose: {pose_name}")
+            return False
+
+        if self._sim_fast:
+            self._apply_targets_sim(plan.moves, validate=False)
+        else:
+            self._write_channels(plan.updates)
+            self._commit_targets(plan.written)
+            self._next_deadline = time.perf_counter()
+
+        self.current_pose_name = pose_name
+        return True
+
     def home(self, speed: Optional[float] = None, blocking: bool = True) -> bool:
         if "home" in self.poses:
             return self.go_to_pose("home", speed=speed, blocking=blocking)
-        return self.move_to_angles({"shoulder": 0, "elbow": 0, "gripper": 0}, speed=speed, blocking=blocking)
+        return self.move_to_angles(_ZERO_POSE, speed=speed, blocking=blocking)
 
     def neutral(self, speed: Optional[float] = None, blocking: bool = True) -> bool:
         if "neutral" in self.poses:
             return self.go_to_pose("neutral", speed=speed, blocking=blocking)
-        return self.move_to_angles({"shoulder": 0, "elbow": 0, "gripper": 0}, speed=speed, blocking=blocking)
+        return self.move_to_angles(_ZERO_POSE, speed=speed, blocking=blocking)
 
     # ---------------- Convenience controls ----------------
 
@@ -374,6 +1154,28 @@ class ArmController:
     def list_poses(self) -> List[str]:
         return sorted(self.poses.keys())
 
+    def _resolve_sequence(
+        self, sequence: List[Tuple], pause_between: float
+    ) -> Optional[List[Tuple[str, np.ndarray, Optional[float], float]]]:
+        """
+        (pose name, calibrated targets, speed, pause) per step. Every pose is
+        resolved up front: an unknown name fails the sequence (None) before the
+        arm moves at all.
+        """
+        steps: List[Tuple[str, np.ndarray, Optional[float], float]] = []
+        for i, step in enumerate(sequence):
+            targets = self._pose_targets_for(step[0])
+            if targets is None:
+                logger.error(f"Unknown pose: {step[0]} (sequence step {i+1}); not executing")
+                return None
+            steps.append((
+                step[0],
+                targets,
+                step[1] if len(step) >= 2 else None,
+                step[2] if len(step) >= 3 else pause_between,
+            ))
+        return steps
+
     def execute_sequence(self, sequence: List[Tuple], pause_between: float = 0.5) -> bool:
         """
         sequence elements:
@@ -382,29 +1184,136 @@ class ArmController:
           - (pose_name, speed, pause)
         """
         logger.info(f"Executing sequence of {len(sequence)} poses")
-        for i, step in enumerate(sequence):
-            pose_name = step[0]
-            speed = step[1] if len(step) >= 2 else None
-            pause = step[2] if len(step) >= 3 else pause_between
 
-            logger.info(f"Step {i+1}/{len(sequence)}: {pose_name}")
-            if not self.go_to_pose(pose_name, speed=speed, blocking=True):
+        steps = self._resolve_sequence(sequence, pause_between)
+        if steps is None:
+            return False
+
+        plan = self._plan_targets(steps[0][1], steps[0][2]) if steps else None
+        for i, (pose_name, _targets, _speed, pause) in enumerate(steps):
+            logger.info("Step %d/%d: %s", i + 1, len(steps), pose_name)
+            if not self.is_enabled:
                 logger.error(f"Sequence failed at step {i+1} ({pose_name})")
                 return False
-            time.sleep(pause)
+
+            if plan is not None:
+                self._dispatch(plan)
+            self.current_pose_name = pose_name
+            self._next_deadline = max(self._next_deadline, time.perf_counter()) + float(pause)
+
+            # The ramp has finished writing by now: plan the next step during this
+            # step's pause (and the move's last tick), then wait out the rest
+            if i + 1 < len(steps):
+                plan = self._plan_targets(steps[i + 1][1], steps[i + 1][2])
+            self._wait_until(self._next_deadline, self.spinlock_slack_s)
 
         logger.info("Sequence complete")
         return True
 
+    def compile_sequence(self, sequence: List[Tuple], pause_between: float = 0.5) -> Optional[CompiledSequence]:
+        """
+        Pre-render a sequence (same format as execute_sequence) into every PCA9685
+        write it would make: frames rows of (t_s, channel, off ticks), t_s being
+        seconds from the start of the run. Starts from the arm's current state;
+        nothing is written. None if a pose is unknown.
+        """
+        steps = self._resolve_sequence(sequence, pause_between)
+        if steps is None:
+            return None
+
+        currents = self._currents.copy()
+        last_ticks = np.array(
+            [s._last_pwm[1] if s._last_pwm is not None else 0 for s in self._servos_tup], dtype=np.uint16
+        )
+        chunks: List[np.ndarray] = []
+        t0 = 0.0
+        for _name, targets, speed, pause in steps:
+            speed = max(float(speed) if speed is not None else self.default_speed, 1.0)
+            joints = np.flatnonzero(~np.isnan(targets))
+            if len(joints):
+                duration = float(np.abs(targets[joints] - currents[joints]).max()) / speed
+                end = np.array([self._servos_tup[i].compute_pulse(float(targets[i]))[1] for i in joints], dtype=np.uint16)
+                # Same rule as _run_ramp: a channel with no known ticks jumps straight to its target
+                begin = np.where(last_ticks[joints] > 0, last_ticks[joints], end).astype(np.uint16)
+                n_steps = max(int(duration * self.smooth_hz), 1) if duration > 0 else 1
+                rows = np.empty((n_steps, len(joints)), dtype=np.uint16)
+                ramp_ticks(begin, end, n_steps, rows)
+
+                frames = np.empty((n_steps, len(joints), 3))
+                # Same timing as _run_ramp: row i at (i + 1) / n_steps of the move
+                frames[:, :, 0] = (t0 + np.arange(1, n_steps + 1) * (duration / n_steps))[:, None]
+                frames[:, :, 1] = self._channels[joints]
+                frames[:, :, 2] = rows
+                chunks.append(frames.reshape(-1, 3))
+
+                currents[joints] = targets[joints]
+                last_ticks[joints] = end
+            else:
+                duration = 0.0
+            t0 += duration + float(pause)
+
+        final = np.full(len(SERVO_NAMES), np.nan)
+        for _name, targets, _speed, _pause in steps:
+            given = ~np.isnan(targets)
+            final[given] = targets[given]
+        frames = np.concatenate(chunks) if chunks else np.empty((0, 3))
+        return CompiledSequence(frames, final, t0)
+
+    def run_compiled(self, compiled: CompiledSequence) -> bool:
+        """
+        Play a compile_sequence() result: one batched write per distinct frame
+        time on the deadline clock, then record the final joint angles. Blocks
+        until the whole sequence (including its last pause) has elapsed.
+        current_pose_name is left unchanged.
+        """
+        if not self.is_enabled:
+            logger.warning("Arm is disabled; ignoring run_compiled")
+            return False
+
+        final_moves = self._moves(compiled.final)
+        if self._sim_fast:
+            self._apply_targets_sim(final_moves, validate=False)
+            return True
+
+        frames = compiled.frames
+        start = max(self._next_deadline, time.perf_counter())
+        self._next_deadline = start + compiled.duration
+        if len(frames):
+            bounds = np.flatnonzero(np.diff(frames[:, 0])) + 1
+            for group in np.split(frames, bounds):
+                if not self.is_enabled:
+                    logger.error("Compiled sequence aborted: arm disabled")
+                    return False
+                precise_wait(start + group[0, 0], self.spinlock_slack_s)
+                self._write_channels({int(ch): (0, int(t)) for _, ch, t in group})
+
+        _, written = self._prepare_targets(final_moves, validate=False)
+        self._commit_targets(written)
+        self._wait_until(self._next_deadline, self.spinlock_slack_s)
+        return True
+
     def emergency_stop(self) -> None:
-        """Immediate safest action: disable outputs now."""
-        logger.critical("EMERGENCY STOP: disabling all servos NOW")
-        self.disable()
+        """
+        Immediate safest action: disable outputs now.
+        One broadcast full-OFF write for every channel first, then the
+        per-servo bookkeeping without further I/O.
+        """
+        self.pwm.all_off()
+        self.is_enabled = False
+        logger.critical("EMERGENCY STOP: all servo outputs disabled")
+        for servo in self._servos_tup:
+            servo.mark_disabled()
+        if self._stream_thread is not None:
+            # A streamed write may have raced the one above: stop, then re-assert
+            self.stop_command_stream()
+            self.pwm.all_off()
 
     def disable(self) -> None:
         logger.warning("Disabling arm (all servos)")
-        for servo in self.servos.values():
-            servo.disable()
+        # Arm channels only (other PCA9685 outputs are left alone), in one burst
+        self._write_channels({s.channel: (0, 0) for s in self._servos_tup})
+        for servo in self._servos_tup:
+            servo.mark_disabled()
         self.is_enabled = False
 
     def enable(self) -> None:
@@ -419,10 +1328,12 @@ class ArmController:
         - close PCA9685
         """
         logger.info("Closing ArmController")
+        self.stop_command_stream()
         try:
             self.disable()
         finally:
             self.pwm.close()
+            self._close_telemetry()
 
     def __enter__(self):
         return self
@@ -0,0 +1,68 @@
+"""
+Single-producer / single-consumer ring buffer for arm commands.
+
+Fixed-capacity ring of float vectors (one slot = one target per joint),
+preallocated as a NumPy array. The producer only writes `_head` and the
+consumer only writes `_tail`; each index is published with a single attribute
+store after its slot is filled/read, which the GIL makes atomic and ordered,
+so no lock is needed between the planner thread and the I2C thread.
+
+Exactly one thread may push and exactly one may pop.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class SpscRing:
+    __slots__ = ("_buf", "_mask", "_head", "_tail")
+
+    def __init__(self, capacity: int, width: int):
+        capacity = int(capacity)
+        if capacity < 2 or capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two >= 2, got {capacity}")
+
+        self._buf = np.empty((capacity, int(width)), dtype=np.float64)
+        self._mask = capacity - 1
+        # Monotonic counters (Python ints don't wrap); slot = counter & mask
+        self._head = 0
+        self._tail = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._mask + 1
+
+    def push(self, vec) -> bool:
+        """Copy `vec` into the next slot. Returns False (dropping it) if full."""
+        head = self._head
+        if head - self._tail > self._mask:
+            return False
+        self._buf[head & self._mask] = vec
+        self._head = head + 1  # publish only after the slot is written
+        return True
+
+    def pop(self, out: np.ndarray) -> bool:
+        """Copy the oldest vector into `out`. Returns False if empty."""
+        tail = self._tail
+        if tail == self._head:
+            return False
+        out[:] = self._buf[tail & self._mask]
+        self._tail = tail + 1  # release the slot only after it is read
+        return True
+
+    def pop_latest(self, out: np.ndarray) -> int:
+        """
+        Drain everything queued, copying only the newest vector into `out`.
+        Returns how many vectors were consumed (0 = empty, `out` untouched).
+        """
+        tail = self._tail
+        head = self._head
+        if tail == head:
+            return 0
+        out[:] = self._buf[(head - 1) & self._mask]
+        self._tail = head
+        return head - tail
+
+    def __len__(self) -> int:
+        return self._head - self._tail
@@ -9,20 +9,35 @@ Interface: I2C
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+from contextlib import contextmanager
+import logging
 import time
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from utils.logger import get_logger
+from arm._i2c_fast import FAST_I2C_AVAILABLE, I2CBus
 
 logger = get_logger(__name__)
 
-try:
-    import smbus2 as smbus
-    I2C_AVAILABLE = True
-except ImportError:
-    I2C_AVAILABLE = False
+# smbus2 is only imported when a bus is actually opened on hardware (see
+# _open_bus); simulation and the raw ioctl path never load it.
+I2C_AVAILABLE = importlib.util.find_spec("smbus2") is not None
+if not (I2C_AVAILABLE or FAST_I2C_AVAILABLE):
     logger.warning("smbus2 not available - PCA9685 will run in simulation mode")
 
 
+@functools.lru_cache(maxsize=None)
+def _smbus2():
+    """Import smbus2 on first use."""
+    import smbus2
+
+    return smbus2
+
+
 # PCA9685 Register Addresses
 MODE1 = 0x00
 MODE2 = 0x01
@@ -36,19 +51,72 @@ ALL_LED_OFF_H = 0xFD
 # Mode register bits
 RESTART = 0x80
 SLEEP = 0x10
+AI = 0x20  # register auto-increment (needed for block writes)
 OUTDRV = 0x04
 INVRT = 0x10
 
+# LEDn_OFF_H bit 4: output forced fully off (overrides the ON/OFF counts)
+FULL_OFF = 0x10
+_ALL_OFF_PAYLOAD = bytes((ALL_LED_OFF_H, FULL_OFF))
+
+# LEDn_ON_L register for each channel (its block of 4 registers starts here)
+_CHANNEL_BASE = tuple(LED0_ON_L + 4 * ch for ch in range(16))
+
+
+class _SharedChip:
+    """An open, initialized PCA9685 connection shared by every driver on it."""
+
+    __slots__ = ("bus", "raw_io", "last_sent", "frequency", "refs")
+
+    def __init__(self, bus, raw_io: bool, last_sent: list, frequency: int):
+        self.bus = bus
+        self.raw_io = raw_io
+        self.last_sent = last_sent
+        self.frequency = frequency
+        self.refs = 1
+
+
+# (i2c_bus, address) -> connection, so constructing another driver (e.g. another
+# ArmController) for the same chip skips reopening the bus and re-running setup
+_PCA_CACHE: Dict[Tuple[int, int], _SharedChip] = {}
+
 
 def _clamp_int(x: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, x))
 
 
+def read_bus_clock_hz(i2c_bus: int) -> Optional[int]:
+    """
+    I2C bus clock as configured in the device tree (big-endian u32 in sysfs),
+    or None if it can't be read (not a Pi / no device-tree node).
+    """
+    path = f"/sys/class/i2c-adapter/i2c-{int(i2c_bus)}/of_node/clock-frequency"
+    try:
+        with open(path, "rb") as f:
+            raw = f.read(4)
+    except OSError:
+        return None
+    return int.from_bytes(raw, "big") if len(raw) == 4 else None
+
+
 class PCA9685:
     """
     PCA9685 PWM driver for servo control.
 
     Controls up to 16 channels with 12-bit resolution (0-4095).
+
+    Channel updates are sent as single combined I2C transactions
+    (register pointer + data, auto-increment). Run the bus in fast mode for
+    lowest latency: add `dtparam=i2c_arm_baudrate=400000` to /boot/config.txt.
+
+    On Linux the bus is driven through a raw I2C_RDWR ioctl with preallocated
+    buffers (arm/_i2c_fast.py); smbus2 is used if that path can't be opened.
+
+    Drivers created for the same (bus, address) and frequency share one open,
+    already-initialized connection; the last one to close() shuts it down.
+    Asking for a different frequency on a chip that is already open (in the
+    constructor, or via set_pwm_freq while shared) raises ValueError.
+    Like the bus itself, a shared connection is meant for one thread at a time.
     """
 
     def __init__(
@@ -57,26 +125,146 @@ class PCA9685:
         address: int = 0x40,
         frequency: int = 50,
         simulate: bool = False,
+        i2c_baudrate: Optional[int] = None,
+        bus=None,
+        reset_on_close: bool = True,
     ):
+        """
+        bus: an already-open bus (smbus2.SMBus or I2CBus) to drive the chip
+            through instead of opening i2c_bus; the caller keeps ownership, so
+            close() leaves it open.
+        reset_on_close: zero every channel when the chip is closed. Turn off
+            where that would glitch servos that should keep holding position.
+        """
         self.address = address
         self.frequency = int(frequency)
-        self.simulate = bool(simulate) or (not I2C_AVAILABLE)
+        self.simulate = bool(simulate) or not (I2C_AVAILABLE or FAST_I2C_AVAILABLE)
+
+        self.bus = None
+        # True when self.bus is an I2CBus (raw ioctl) rather than smbus2.SMBus
+        self._raw_io = False
+        # (on, off) last written to each channel, None = unknown. Lets set_pwm /
+        # set_multi_pwm skip writes that would not change the chip's registers.
+        self._last_sent: List[Optional[Tuple[int, int]]] = [None] * 16
+        # Per-channel write payloads (register pointer prefilled), refilled in
+        # place by _set_pwm_fast instead of building a new tuple per update
+        self._ch_buf = [bytearray((base, 0, 0, 0, 0)) for base in _CHANNEL_BASE]
+        # Channel -> (on, off) queued inside transaction(); None outside one
+        self._pending: Optional[Dict[int, Tuple[int, int]]] = None
+
+        # Last MODE1 value this driver wrote (None = unknown, read it from the chip)
+        self._mode1: Optional[int] = None
+        # Key into _PCA_CACHE while this driver holds a shared connection
+        self._shared_key: Optional[Tuple[int, int]] = None
+        # False when the bus was handed in: close() must not close it
+        self._owned_bus = bus is None
+        self.reset_on_close = bool(reset_on_close)
+
+        if self.simulate and bus is None:
+            logger.warning("PCA9685 running in SIMULATION mode")
+            return
 
-        self.bus: Optional[smbus.SMBus] = None
+        if bus is not None:
+            self.simulate = False
+            self.bus = bus
+            self._raw_io = isinstance(bus, I2CBus)
+            try:
+                self._initialize()
+            except Exception as e:
+                logger.error(f"Failed to initialize PCA9685 on the given bus: {e}")
+                raise
+            logger.info(f"PCA9685 initialized on provided bus, address 0x{address:02X}")
+            return
 
-        if self.simulate:
-            logger.warning("PCA9685 running in SIMULATION mode")
+        key = (int(i2c_bus), int(address))
+        shared = _PCA_CACHE.get(key)
+        if shared is not None and shared.frequency != self.frequency:
+            # Reprogramming the prescaler would break the tick math of every other holder
+            raise ValueError(
+                f"PCA9685 on bus {i2c_bus}, address 0x{address:02X} is already open at "
+                f"{shared.frequency}Hz; cannot also drive it at {self.frequency}Hz"
+            )
+        if shared is not None:
+            # Same chip already open and configured: share its bus and write cache
+            shared.refs += 1
+            self.bus = shared.bus
+            self._raw_io = shared.raw_io
+            self._last_sent = shared.last_sent
+            self._shared_key = key
+            logger.info(f"PCA9685 on bus {i2c_bus}, address 0x{address:02X}: reusing open connection")
             return
 
         try:
-            self.bus = smbus.SMBus(i2c_bus)
+            self.bus = self._open_bus(i2c_bus)
             logger.info(f"PCA9685 initialized on bus {i2c_bus}, address 0x{address:02X}")
+            self._check_bus_clock(i2c_bus, i2c_baudrate)
             self._initialize()
         except Exception as e:
             logger.error(f"Failed to initialize PCA9685: {e}")
             logger.warning("Falling back to simulation mode")
             self.simulate = True
             self.bus = None
+            return
+
+        if key not in _PCA_CACHE:
+            _PCA_CACHE[key] = _SharedChip(self.bus, self._raw_io, self._last_sent, self.frequency)
+            self._shared_key = key
+
+    @property
+    def frequency(self) -> int:
+        """PWM frequency (Hz). Setting it (set_pwm_freq does) refreshes _ticks_per_us."""
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, freq_hz: int) -> None:
+        self._frequency = int(freq_hz)
+        # 4096 ticks per PWM period: ticks = pulse_us * _ticks_per_us
+        self._ticks_per_us = 4096.0 * self._frequency / 1_000_000.0
+
+    def _check_bus_clock(self, i2c_bus: int, wanted_hz: Optional[int]) -> None:
+        """Log the bus clock and warn if it is below the configured baudrate."""
+        actual = read_bus_clock_hz(i2c_bus)
+        if actual is None:
+            logger.debug(f"I2C bus {i2c_bus} clock unknown (no device-tree clock-frequency)")
+            return
+        logger.info(f"I2C bus {i2c_bus} clock: {actual // 1000} kHz")
+        if wanted_hz and actual < int(wanted_hz):
+            logger.warning(
+                f"I2C bus {i2c_bus} runs at {actual // 1000} kHz, below the configured "
+                f"{int(wanted_hz) // 1000} kHz. Add dtparam=i2c_arm_baudrate={int(wanted_hz)} to "
+                f"/boot/config.txt and reboot (PCA9685 supports up to 1 MHz; check pull-ups/wiring)."
+            )
+
+    def _open_bus(self, i2c_bus: int):
+        """Prefer the raw ioctl bus; fall back to smbus2."""
+        if FAST_I2C_AVAILABLE:
+            try:
+                bus = I2CBus(i2c_bus)
+                self._raw_io = True
+                return bus
+            except OSError as e:
+                if not I2C_AVAILABLE:
+                    raise
+                logger.warning(f"Raw I2C access failed ({e}); using smbus2")
+        self._raw_io = False
+        return _smbus2().SMBus(i2c_bus)
+
+    def _write_block(self, data: Sequence[int]) -> None:
+        """Register pointer + data bytes as one I2C write transaction."""
+        if self._raw_io:
+            self.bus.write(self.address, data)
+        else:
+            self.bus.i2c_rdwr(_smbus2().i2c_msg.write(self.address, data))
+
+    def _write_blocks(self, *payloads: Sequence[int]) -> None:
+        """Several register writes as one combined I2C transaction (repeated START)."""
+        if self.simulate or self.bus is None:
+            return
+        if self._raw_io:
+            self.bus.write_many(self.address, payloads)
+        else:
+            i2c_msg = _smbus2().i2c_msg
+            self.bus.i2c_rdwr(*(i2c_msg.write(self.address, p) for p in payloads))
 
     def _write_byte(self, register: int, value: int) -> None:
         if self.simulate or self.bus is None:
@@ -89,20 +277,20 @@ class PCA9685:
         return int(self.bus.read_byte_data(self.address, register))
 
     def _initialize(self) -> None:
-        """Initialize the PCA9685 chip."""
-        # Reset MODE1
-        self._write_byte(MODE1, 0x00)
-        time.sleep(0.005)
-
-        # Set PWM frequency
+        """
+        Initialize the PCA9685 chip in three write transactions and no reads:
+        MODE1/MODE2, then sleep + prescale + wake, then RESTART after 5 ms.
+        """
+        # One transaction: reset MODE1 (auto-increment on so channel registers can
+        # be block-written) and set MODE2 for servo output (totem pole,
+        # non-inverted; the other MODE2 bits at their power-on defaults). Both
+        # values are known, so no read-modify-write.
+        self._write_blocks((MODE1, AI), (MODE2, OUTDRV & ~INVRT))
+        self._mode1 = AI
+
+        # Set PWM frequency (puts the oscillator to sleep and restarts it itself)
         self.set_pwm_freq(self.frequency)
 
-        # Configure MODE2 for servo output (totem pole, non-inverted)
-        mode2 = self._read_byte(MODE2)
-        mode2 = mode2 | OUTDRV
-        mode2 = mode2 & ~INVRT
-        self._write_byte(MODE2, mode2)
-
         logger.debug("PCA9685 initialized successfully")
 
     def set_pwm_freq(self, freq_hz: int) -> None:
@@ -111,6 +299,14 @@ class PCA9685:
         """
         freq_hz = int(freq_hz)
 
+        shared = _PCA_CACHE.get(self._shared_key) if self._shared_key is not None else None
+        if shared is not None and shared.refs > 1 and freq_hz != shared.frequency:
+            # The other holders' frequency, _ticks_per_us and LUTs would go stale
+            raise ValueError(
+                f"PCA9685 connection is shared by {shared.refs} drivers at {shared.frequency}Hz; "
+                f"close the others before changing it to {freq_hz}Hz"
+            )
+
         if self.simulate:
             self.frequency = freq_hz
             logger.debug(f"[SIM] Set PWM frequency to {freq_hz}Hz")
@@ -128,15 +324,19 @@ class PCA9685:
 
         logger.debug(f"Setting PWM frequency to {freq_hz}Hz (prescale: {prescale})")
 
-        oldmode = self._read_byte(MODE1)
+        oldmode = self._mode1 if self._mode1 is not None else self._read_byte(MODE1)
         newmode = (oldmode & 0x7F) | SLEEP  # sleep
-        self._write_byte(MODE1, newmode)
-        self._write_byte(PRESCALE, prescale)
-        self._write_byte(MODE1, oldmode)
+        # Sleep, new prescale (only writable while asleep) and wake in one
+        # transaction: each message completes before the next starts
+        self._write_blocks((MODE1, newmode), (PRESCALE, prescale & 0xFF), (MODE1, oldmode))
+        # RESTART only after the oscillator has settled (>= 500 us), so it can't join them
         time.sleep(0.005)
         self._write_byte(MODE1, oldmode | RESTART)
 
         self.frequency = freq_hz
+        self._forget_sent()
+        if shared is not None:
+            shared.frequency = freq_hz
 
     def set_pwm(self, channel: int, on: int, off: int) -> None:
         """
@@ -153,34 +353,191 @@ class PCA9685:
         if not (0 <= on <= 4095) or not (0 <= off <= 4095):
             raise ValueError(f"ON/OFF must be 0-4095 (on={on}, off={off})")
 
+        self._set_pwm_fast(channel, on, off)
+
+    def _set_pwm_fast(self, channel: int, on: int, off: int) -> None:
+        """
+        set_pwm without range checks or int() coercion, for callers whose values
+        are already valid ints (e.g. Servo, whose channel is checked once at
+        construction and whose ticks come from its clamped LUT).
+        """
         if self.simulate:
-            logger.debug(f"[SIM] Channel {channel}: ON={on}, OFF={off}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SIM] Channel %d: ON=%d, OFF=%d", channel, on, off)
             return
 
-        base_reg = LED0_ON_L + 4 * channel
-        self._write_byte(base_reg + 0, on & 0xFF)
-        self._write_byte(base_reg + 1, (on >> 8) & 0xFF)
-        self._write_byte(base_reg + 2, off & 0xFF)
-        self._write_byte(base_reg + 3, (off >> 8) & 0xFF)
+        if self.bus is None:
+            return
 
-    def set_pulse_width(self, channel: int, pulse_width_us: int) -> None:
+        pwm = (on, off)
+        if self._pending is not None:
+            # Compared against _last_sent only at flush: a later write in the
+            # same transaction may still change this channel back
+            self._pending[channel] = pwm
+            return
+        if self._last_sent[channel] == pwm:
+            return
+
+        # One transaction: register pointer + ON_L, ON_H, OFF_L, OFF_H (auto-increment)
+        buf = self._ch_buf[channel]
+        buf[1] = on & 0xFF
+        buf[2] = (on >> 8) & 0xFF
+        buf[3] = off & 0xFF
+        buf[4] = (off >> 8) & 0xFF
+        self._last_sent[channel] = None  # unknown until the write succeeds
+        self._write_block(buf)
+        self._last_sent[channel] = pwm
+
+    def set_multi_pwm(self, start_channel: int, pairs: Sequence[Tuple[int, int]]) -> None:
         """
-        Set servo position using pulse width in microseconds.
-        Typical servo range: ~500-2500us.
+        Set PWM timing for consecutive channels in one burst.
+
+        start_channel: first channel (0-15)
+        pairs: (on, off) tick counts for start_channel, start_channel+1, ...
+
+        Channel registers are contiguous (LED0_ON_L + 4*ch), so with MODE1.AI set
+        the whole run goes out as a single I2C write instead of 4 writes/channel.
+        """
+        self.set_pwm_runs(((start_channel, pairs),))
+
+    def set_pwm_runs(self, runs: Sequence[Tuple[int, Sequence[Tuple[int, int]]]]) -> None:
+        """
+        Like set_multi_pwm for several (start_channel, pairs) runs at once: every
+        run that still needs writing goes out in one combined I2C transaction
+        (one message per run, repeated START between them).
+        """
+        if self._pending is not None:
+            for start_channel, pairs in runs:
+                for channel, (on, off) in enumerate(pairs, int(start_channel)):
+                    self.set_pwm(channel, on, off)
+            return
+
+        pending: List[Tuple[int, List[Tuple[int, int]]]] = []
+        for start_channel, pairs in runs:
+            run = self._checked_run(int(start_channel), pairs)
+            if run is not None:
+                pending.append(run)
+        if not pending:
+            return
+
+        payloads: List[List[int]] = []
+        for start_channel, run in pending:
+            data: List[int] = [_CHANNEL_BASE[start_channel]]
+            for on, off in run:
+                data += (on & 0xFF, (on >> 8) & 0xFF, off & 0xFF, (off >> 8) & 0xFF)
+            payloads.append(data)
+
+        # Plain I2C writes (not SMBus block), so no 32-byte cap: all 16 channels fit
+        last = self._last_sent
+        for start_channel, run in pending:
+            last[start_channel:start_channel + len(run)] = [None] * len(run)
+        if len(payloads) == 1:
+            self._write_block(payloads[0])
+        else:
+            self._write_blocks(*payloads)
+        for start_channel, run in pending:
+            last[start_channel:start_channel + len(run)] = run
+
+    @contextmanager
+    def transaction(self) -> Iterator["PCA9685"]:
+        """
+        Queue channel writes (set_pwm, set_pulse_width, set_multi_pwm, ...) made
+        inside the block and send them on exit as one combined I2C transaction,
+        one message per run of consecutive channels. The last value written to
+        a channel wins. Nothing is sent if the block raises.
+
+        Frequency, all-call and raw writes still go out immediately. Nested
+        transactions join the outermost one.
+
+            with pca.transaction():
+                shoulder.set_angle(40)
+                elbow.set_angle(95)
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        self._pending = {}
+        try:
+            yield self
+            queued = self._pending
+        finally:
+            self._pending = None
+
+        runs: List[Tuple[int, List[Tuple[int, int]]]] = []
+        for channel in sorted(queued):
+            if runs and runs[-1][0] + len(runs[-1][1]) == channel:
+                runs[-1][1].append(queued[channel])
+            else:
+                runs.append((channel, [queued[channel]]))
+        self.set_pwm_runs(runs)
+
+    def _checked_run(
+        self, start_channel: int, pairs: Sequence[Tuple[int, int]]
+    ) -> Optional[Tuple[int, List[Tuple[int, int]]]]:
+        """
+        Validate one run and trim it to what must actually be written, or None
+        if nothing needs writing (empty, simulated, or unchanged).
+        """
+        if not pairs:
+            return None
+        end_channel = start_channel + len(pairs) - 1
+        if start_channel < 0 or end_channel > 15:
+            raise ValueError(f"Channels must be 0-15, got {start_channel}-{end_channel}")
+
+        run: List[Tuple[int, int]] = []
+        for on, off in pairs:
+            on = int(on)
+            off = int(off)
+            if not (0 <= on <= 4095) or not (0 <= off <= 4095):
+                raise ValueError(f"ON/OFF must be 0-4095 (on={on}, off={off})")
+            run.append((on, off))
+
+        if self.simulate or self.bus is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SIM] Channels %d-%d: %s", start_channel, end_channel, run)
+            return None
+
+        # Trim channels at either end whose registers already hold these values;
+        # unchanged channels inside the run are cheaper to resend than to split on.
+        last = self._last_sent
+        while run and last[start_channel] == run[0]:
+            run.pop(0)
+            start_channel += 1
+        while run and last[start_channel + len(run) - 1] == run[-1]:
+            run.pop()
+        return (start_channel, run) if run else None
+
+    def pulse_to_ticks(self, pulse_width_us: int) -> int:
+        """
+        Convert a pulse width in microseconds to a 12-bit tick count at the
+        current frequency. Pure math, no I/O.
         """
         pulse_width_us = int(pulse_width_us)
         if pulse_width_us < 0 or pulse_width_us > 10000:
             raise ValueError(f"Pulse width must be 0-10000us, got {pulse_width_us}")
 
-        # One PWM period in microseconds
-        period_us = 1_000_000.0 / float(self.frequency)
-        # Microseconds per PCA tick
-        us_per_tick = period_us / 4096.0
+        ticks = int(round(pulse_width_us * self._ticks_per_us))
+        return _clamp_int(ticks, 0, 4095)
+
+    def pulses_to_ticks(self, pulse_widths_us: np.ndarray) -> np.ndarray:
+        """Vectorized pulse_to_ticks for an array of pulse widths (uint16 result)."""
+        pulses = np.asarray(pulse_widths_us, dtype=np.float64)
+        if pulses.size and (pulses.min() < 0 or pulses.max() > 10000):
+            raise ValueError("Pulse widths must be 0-10000us")
+
+        ticks = np.rint(np.trunc(pulses) * self._ticks_per_us)
+        return np.clip(ticks, 0, 4095).astype(np.uint16)
 
-        ticks = int(round(pulse_width_us / us_per_tick))
-        ticks = _clamp_int(ticks, 0, 4095)
+    def set_pulse_width(self, channel: int, pulse_width_us: int) -> None:
+        """
+        Set servo position using pulse width in microseconds.
+        Typical servo range: ~500-2500us.
+        """
+        ticks = self.pulse_to_ticks(pulse_width_us)
 
-        logger.debug(f"Channel {channel}: {pulse_width_us}us -> {ticks} ticks @ {self.frequency}Hz")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Channel %d: %sus -> %d ticks @ %sHz", channel, pulse_width_us, ticks, self.frequency)
         self.set_pwm(channel, 0, ticks)
 
     def disable_channel(self, channel: int) -> None:
@@ -191,29 +548,85 @@ class PCA9685:
         self.set_pwm(channel, 0, 0)
 
     def set_all_pwm(self, on: int, off: int) -> None:
+        """Set every channel at once: one ALL_LED_ON_L..ALL_LED_OFF_H block write."""
         if self.simulate:
-            logger.debug(f"[SIM] All channels: ON={on}, OFF={off}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SIM] All channels: ON=%s, OFF=%s", on, off)
             return
 
+        self.write_raw(self.all_call_payload(on, off))
+
+    @staticmethod
+    def all_call_payload(on: int, off: int) -> bytes:
+        """
+        Build the raw ALL_LED_ON_L..ALL_LED_OFF_H write for write_raw().
+        The ALL_LED registers broadcast to every channel in one transaction.
+        """
         on = _clamp_int(int(on), 0, 4095)
         off = _clamp_int(int(off), 0, 4095)
+        return bytes([ALL_LED_ON_L, on & 0xFF, (on >> 8) & 0xFF, off & 0xFF, (off >> 8) & 0xFF])
 
-        self._write_byte(ALL_LED_ON_L, on & 0xFF)
-        self._write_byte(ALL_LED_ON_H, (on >> 8) & 0xFF)
-        self._write_byte(ALL_LED_OFF_L, off & 0xFF)
-        self._write_byte(ALL_LED_OFF_H, (off >> 8) & 0xFF)
+    def all_off(self) -> None:
+        """
+        Force every channel fully off with one 2-byte write: the full-OFF bit via
+        the ALL_LED_OFF_H broadcast register. The next set_pwm/set_multi_pwm
+        on a channel clears it again.
+        """
+        self.write_raw(_ALL_OFF_PAYLOAD)
+
+    def write_raw(self, payload: bytes) -> None:
+        """Send a prebuilt register-pointer + data payload as a single I2C write."""
+        if self.simulate or self.bus is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SIM] Raw write: %s", payload.hex())
+            return
+        # Raw payloads may hit any channel (or the ALL_LED broadcast registers)
+        self._forget_sent()
+        self._write_block(payload)
+
+    def _forget_sent(self) -> None:
+        """Drop the last-sent cache so the next write to every channel goes out."""
+        # In place: drivers sharing this chip share the list
+        self._last_sent[:] = [None] * 16
 
     def reset(self) -> None:
         """Reset all PWM channels to 0."""
         logger.info("Resetting all PWM channels")
         self.set_all_pwm(0, 0)
 
+    def release(self) -> bool:
+        """
+        Drop this driver's reference to a shared connection. Returns True if it
+        was the last one (or the bus was never shared), i.e. the caller should
+        really shut the chip down.
+        """
+        key = self._shared_key
+        if key is None:
+            return True
+        self._shared_key = None
+        shared = _PCA_CACHE[key]
+        shared.refs -= 1
+        if shared.refs > 0:
+            self.bus = None
+            return False
+        del _PCA_CACHE[key]
+        return True
+
     def close(self) -> None:
-        """Clean up and close I2C bus."""
+        """
+        Clean up and close the I2C bus; safe to call more than once. With a
+        shared connection only the last driver to close resets the outputs and
+        closes the bus. A bus passed in to __init__ is reset but left open.
+        """
         if not self.simulate and self.bus:
+            if not self.release():
+                logger.debug("PCA9685 connection still in use; detaching")
+                return
             logger.info("Closing PCA9685")
-            self.reset()
-            self.bus.close()
+            if self.reset_on_close:
+                self.reset()
+            if self._owned_bus:
+                self.bus.close()
             self.bus = None
 
     def __enter__(self):
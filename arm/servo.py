@@ -10,9 +10,14 @@ Provides:
 
 from __future__ import annotations
 
+import logging
 import time
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
+
 from utils.logger import get_logger
+from arm._timing import precise_wait
 
 logger = get_logger(__name__)
 
@@ -30,6 +35,16 @@ class Servo:
     - Use invert + offset to fix physical mounting differences.
     """
 
+    __slots__ = (
+        "pwm", "channel", "name",
+        "min_angle", "max_angle", "home_angle", "neutral_angle",
+        "min_pulse", "max_pulse",
+        "invert", "offset_deg", "smooth_hz", "spin_slack_s", "simulate",
+        "_current_angle", "_target_angle", "_last_pwm",
+        "_lut", "_lut_scale", "_lut_freq",
+        "_inv_angle_range", "_pulse_range",
+    )
+
     def __init__(
         self,
         pwm_controller,
@@ -44,9 +59,13 @@ class Servo:
         invert: bool = False,
         offset_deg: float = 0.0,
         smooth_hz: float = 10.0,  # updates/sec when smoothing
+        spin_slack_s: float = 0.0,  # busy-wait this long before each step (0 = sleep only)
+        simulate: bool = False,  # record angles only: no pulse math, no smoothing waits
     ):
         self.pwm = pwm_controller
         self.channel = int(channel)
+        if not 0 <= self.channel <= 15:
+            raise ValueError(f"Channel must be 0-15, got {self.channel}")
         self.name = name.lower()
 
         self.min_angle = float(min_angle)
@@ -60,9 +79,20 @@ class Servo:
         self.invert = bool(invert)
         self.offset_deg = float(offset_deg)
         self.smooth_hz = float(smooth_hz)
+        self.spin_slack_s = float(spin_slack_s)
+        self.simulate = bool(simulate)
 
         self._current_angle: Optional[float] = None
         self._target_angle: Optional[float] = None
+        # Last (on, off) ticks written to this channel; used to fill gaps in batched writes
+        self._last_pwm: Optional[Tuple[int, int]] = None
+
+        # angle -> off-tick lookup table (see build_lut)
+        self._lut: Optional[np.ndarray] = None
+        self._lut_scale = 0.0
+        self._lut_freq = 0
+
+        self._cache_mapping()
 
         logger.info(
             f"Initialized {self.name} servo on channel {self.channel} "
@@ -71,13 +101,12 @@ class Servo:
 
     def _clamp_angle(self, angle: float) -> float:
         a = float(angle)
-        if a < self.min_angle:
-            logger.warning(f"{self.name}: angle {a}° below min {self.min_angle}°, clamping")
-            return self.min_angle
-        if a > self.max_angle:
-            logger.warning(f"{self.name}: angle {a}° above max {self.max_angle}°, clamping")
-            return self.max_angle
-        return a
+        # In range (the common case): one chained comparison, nothing else
+        if self.min_angle <= a <= self.max_angle:
+            return a
+        clamped = min(self.max_angle, max(self.min_angle, a))
+        logger.warning("%s: angle %s° outside %s°-%s°, clamping", self.name, a, self.min_angle, self.max_angle)
+        return clamped
 
     def _apply_calibration(self, angle: float) -> float:
         """
@@ -90,17 +119,21 @@ class Servo:
             a = self.max_angle - (a - self.min_angle)
         return a
 
+    def _cache_mapping(self) -> None:
+        """Precompute the angle -> pulse constants _angle_to_pulse() uses."""
+        span = self.max_angle - self.min_angle
+        self._inv_angle_range = 1.0 / span if span else 0.0
+        self._pulse_range = self.max_pulse - self.min_pulse
+
     def _angle_to_pulse(self, angle: float) -> int:
         # Prevent bad config divide-by-zero
-        if self.max_angle == self.min_angle:
+        if not self._inv_angle_range:
             logger.warning(f"{self.name}: max_angle == min_angle; defaulting to midpoint pulse")
             return int(round((self.min_pulse + self.max_pulse) / 2))
 
         # Normalize to 0..1
-        ratio = (angle - self.min_angle) / (self.max_angle - self.min_angle)
-        ratio = _clamp(ratio, 0.0, 1.0)
-        pulse = self.min_pulse + ratio * (self.max_pulse - self.min_pulse)
-        pulse_i = int(round(pulse))
+        ratio = _clamp((angle - self.min_angle) * self._inv_angle_range, 0.0, 1.0)
+        pulse_i = int(round(self.min_pulse + ratio * self._pulse_range))
 
         # Final pulse clamp
         if pulse_i < self.min_pulse:
@@ -109,6 +142,68 @@ class Servo:
             pulse_i = self.max_pulse
         return pulse_i
 
+    def build_lut(self, resolution: float = 0.1) -> None:
+        """
+        Precompute the off-tick count for every `resolution` degrees in
+        [min_angle, max_angle] so compute_pulse() becomes a single array index.
+
+        Rebuilt automatically if the PWM frequency changes; call again after
+        editing angle/pulse limits or calibration (this also refreshes the
+        constants _angle_to_pulse uses).
+        """
+        self._cache_mapping()
+        n = int(round((self.max_angle - self.min_angle) / resolution)) + 1
+        angles = np.minimum(self.min_angle + np.arange(n) * resolution, self.max_angle)
+
+        # Same math as _apply_calibration + _angle_to_pulse, over the whole range
+        a = angles + self.offset_deg
+        if self.invert:
+            a = self.max_angle - (a - self.min_angle)
+        if self.max_angle == self.min_angle:
+            pulses = np.full(n, round((self.min_pulse + self.max_pulse) / 2), dtype=np.float64)
+        else:
+            ratio = np.clip((a - self.min_angle) * self._inv_angle_range, 0.0, 1.0)
+            pulses = np.rint(self.min_pulse + ratio * self._pulse_range)
+            pulses = np.clip(pulses, self.min_pulse, self.max_pulse)
+
+        self._lut = self.pwm.pulses_to_ticks(pulses)
+        self._lut_scale = 1.0 / resolution
+        self._lut_freq = self.pwm.frequency
+
+    def compute_pulse(self, angle: float) -> Tuple[int, int]:
+        """
+        Return the PCA9685 (on, off) ticks for an already-validated angle.
+        Does no I/O, so callers can batch several servos into one write.
+        """
+        if self._lut is not None:
+            if self._lut_freq != self.pwm.frequency:
+                self.build_lut(1.0 / self._lut_scale)
+            idx = int((angle - self.min_angle) * self._lut_scale + 0.5)
+            if 0 <= idx < len(self._lut):
+                return 0, int(self._lut[idx])
+
+        pulse = self._angle_to_pulse(self._apply_calibration(float(angle)))
+        return 0, self.pwm.pulse_to_ticks(pulse)
+
+    def ticks_for(self, angles: np.ndarray) -> np.ndarray:
+        """
+        Off-tick counts (uint16) for an array of already-validated angles;
+        the vectorized form of compute_pulse.
+        """
+        if self._lut is not None:
+            if self._lut_freq != self.pwm.frequency:
+                self.build_lut(1.0 / self._lut_scale)
+            idx = ((angles - self.min_angle) * self._lut_scale + 0.5).astype(np.intp)
+            np.clip(idx, 0, len(self._lut) - 1, out=idx)
+            return self._lut[idx]
+        return np.array([self.compute_pulse(a)[1] for a in angles], dtype=np.uint16)
+
+    def mark_written(self, angle: float, pwm: Tuple[int, int]) -> None:
+        """Record that `pwm` (from compute_pulse) was written for `angle`."""
+        self._current_angle = angle
+        self._target_angle = angle
+        self._last_pwm = pwm
+
     def set_angle(self, angle: float, validate: bool = True) -> bool:
         """
         Set servo to specific angle immediately.
@@ -117,15 +212,19 @@ class Servo:
         if validate:
             a = self._clamp_angle(a)
 
-        calibrated = self._apply_calibration(a)
-        pulse = self._angle_to_pulse(calibrated)
-
-        self.pwm.set_pulse_width(self.channel, pulse)
+        if self.simulate:
+            self._current_angle = a
+            self._target_angle = a
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SIM] %s: set %s°", self.name, a)
+            return True
 
-        self._current_angle = a
-        self._target_angle = a
+        on, off = self.compute_pulse(a)
+        self.pwm._set_pwm_fast(self.channel, on, off)
+        self.mark_written(a, (on, off))
 
-        logger.debug(f"{self.name}: set {a}° (cal={calibrated}° -> {pulse}us)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: set %s° -> %s ticks", self.name, a, off)
         return True
 
     def move_to(self, angle: float, speed: Optional[float] = None, blocking: bool = True) -> bool:
@@ -135,8 +234,8 @@ class Servo:
         """
         target = self._clamp_angle(float(angle))
 
-        # Instant if no speed or unknown current
-        if speed is None or self._current_angle is None:
+        # Instant if simulating, no speed or unknown current
+        if self.simulate or speed is None or self._current_angle is None:
             return self.set_angle(target, validate=False)
 
         # If non-blocking, just command final position immediately
@@ -157,19 +256,29 @@ class Servo:
         step_delay = move_time / steps
 
         logger.debug(
-            f"{self.name}: moving {start}° -> {target}° at {speed}°/s "
-            f"({move_time:.2f}s, {steps} steps)"
+            "%s: moving %s° -> %s° at %s°/s (%.2fs, %d steps)",
+            self.name, start, target, speed, move_time, steps,
         )
 
-        for i in range(steps + 1):
-            t = i / steps
-            a = start + delta * t
-            self.set_angle(a, validate=False)
-            if i < steps:
-                time.sleep(step_delay)
-
-        self._current_angle = target
-        self._target_angle = target
+        # Whole trajectory in ticks up front; the loop only writes and sleeps
+        ticks = self.ticks_for(np.linspace(start, target, steps + 1))
+        # Slow moves quantize to runs of equal ticks: only visit steps that change
+        # the output (plus the last, so the move still takes move_time)
+        changed = np.flatnonzero(np.diff(ticks)) + 1
+        if not changed.size or changed[-1] != steps:
+            changed = np.append(changed, steps)
+        ticks = ticks.tolist()
+        set_pwm = self.pwm._set_pwm_fast
+        slack = self.spin_slack_s
+        # Wait for absolute step deadlines so skipped steps and write/sleep
+        # overshoot don't shift the timing of later ones
+        set_pwm(self.channel, 0, ticks[0])
+        t0 = time.perf_counter()
+        for i in changed.tolist():
+            precise_wait(t0 + i * step_delay, slack)
+            set_pwm(self.channel, 0, ticks[i])
+
+        self.mark_written(target, (0, ticks[-1]))
         return True
     
     def home(self, speed: Optional[float] = None, blocking: bool = True) -> bool:
@@ -187,6 +296,11 @@ class Servo:
         """
         logger.info(f"{self.name}: disabling output")
         self.pwm.disable_channel(self.channel)
+        self.mark_disabled()
+
+    def mark_disabled(self) -> None:
+        """Record that this channel's output was turned off (e.g. by a broadcast write)."""
+        self._last_pwm = (0, 0)
 
     def __repr__(self) -> str:
         return (
@@ -0,0 +1,36 @@
+"""
+Trajectory interpolation for the arm.
+
+Multi-waypoint joint-space paths as cubic Hermite splines, sampled on the
+controller's fixed control-rate grid (see ArmController.move_trajectory).
+Two-point moves use the equivalent smoothstep ramp in arm/_ramp_numba.py.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def hermite_path(knots: np.ndarray, n_steps: int) -> np.ndarray:
+    """
+    Sample a cubic Hermite spline through `knots` (n_knots, n_joints), spaced
+    evenly in time. Row i (0-based) is the position at fraction (i + 1) / n_steps,
+    so the last row is exactly the last knot.
+    """
+    knots = np.asarray(knots, dtype=np.float64)
+    n_seg = len(knots) - 1
+    # Catmull-Rom tangents (per segment); zero at both ends so the arm starts and stops at rest
+    tangents = np.zeros_like(knots)
+    tangents[1:-1] = (knots[2:] - knots[:-2]) * 0.5
+
+    u = np.arange(1, n_steps + 1, dtype=np.float64) / n_steps * n_seg
+    seg = np.minimum(u.astype(np.intp), n_seg - 1)
+    t = (u - seg)[:, None]
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        (2.0 * t3 - 3.0 * t2 + 1.0) * knots[seg]
+        + (t3 - 2.0 * t2 + t) * tangents[seg]
+        + (-2.0 * t3 + 3.0 * t2) * knots[seg + 1]
+        + (t3 - t2) * tangents[seg + 1]
+    )
@@ -0,0 +1,27 @@
+"""Shared fixtures: a recording stand-in for the PCA9685's I2C bus."""
+
+import pytest
+
+from tests.fakes import FakeI2CBus
+
+
+@pytest.fixture
+def fake_bus():
+    return FakeI2CBus()
+
+
+@pytest.fixture
+def arm(fake_bus):
+    """ArmController with real-time motion whose PCA9685 writes go to fake_bus."""
+    from arm.arm_controller import ArmController
+    from utils.config_loader import load_config
+
+    cfg = load_config("config/default.yaml")
+    cfg.set("arm.simulate.real_time", True)
+    controller = ArmController(config=cfg, simulate=True)
+    controller.pwm.simulate = False
+    controller.pwm.bus = fake_bus
+    controller.pwm._raw_io = True
+    yield controller
+    controller.pwm.bus = None
+    controller.close()
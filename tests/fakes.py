@@ -0,0 +1,36 @@
+"""Test doubles shared by the test modules."""
+
+import time
+
+from arm._i2c_fast import I2CBus
+
+
+class FakeI2CBus(I2CBus):
+    """
+    I2CBus that records writes instead of issuing ioctls. Each entry in `writes`
+    is (perf_counter time, [message bytes, ...]): one entry per I2C transaction.
+    """
+
+    def __init__(self):
+        self.fd = -1
+        self.writes = []
+        self.fail_next = False
+        self.closed = False
+
+    def _record(self, payloads):
+        if self.fail_next:
+            self.fail_next = False
+            raise OSError("simulated I2C error")
+        self.writes.append((time.perf_counter(), [bytes(p) for p in payloads]))
+
+    def write(self, addr, data):
+        self._record([data])
+
+    def write_many(self, addr, payloads):
+        self._record(payloads)
+
+    def read_byte_data(self, addr, register):
+        return 0
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,48 @@
+"""Ramp timing of ArmController moves, checked against fake-bus write timestamps."""
+
+import time
+
+import numpy as np
+import pytest
+
+
+def test_ramp_reaches_target_at_end_of_move(arm, fake_bus):
+    arm.smooth_hz = 10.0
+    arm.set_angles({"shoulder": 10})
+    fake_bus.writes.clear()
+
+    t_call = time.perf_counter()
+    arm.move_to_angles({"shoulder": 30}, speed=40)  # 20 deg at 40 deg/s: 0.5 s, 5 rows
+    times = [t - t_call for t, _ in fake_bus.writes]
+
+    assert len(times) == 5
+    # First row is 1/5 of the way there, written one step in; nothing at t=0
+    assert times[0] == pytest.approx(0.1, abs=0.02)
+    # Target lands at the end of the move, not one step early
+    assert times[-1] == pytest.approx(0.5, abs=0.02)
+    assert np.diff(times) == pytest.approx([0.1] * 4, abs=0.02)
+    assert arm.servos["shoulder"]._last_pwm == arm.servos["shoulder"].compute_pulse(arm.get_current_angles()["shoulder"])
+
+
+def test_single_step_move_is_not_an_instant_jump(arm, fake_bus):
+    arm.smooth_hz = 10.0
+    arm.set_angles({"shoulder": 10})
+    fake_bus.writes.clear()
+
+    t_call = time.perf_counter()
+    arm.move_to_angles({"shoulder": 12}, speed=40)  # 0.05 s: one row
+    assert len(fake_bus.writes) == 1
+    assert fake_bus.writes[0][0] - t_call == pytest.approx(0.05, abs=0.02)
+
+
+def test_compiled_frames_end_at_move_end(arm):
+    arm.smooth_hz = 10.0
+    arm.set_angles({"shoulder": 10})
+    compiled = arm.compile_sequence([("ready", 90.0, 0.0)])
+    assert compiled is not None
+
+    times = np.unique(compiled.frames[:, 0])
+    dt = times[0]
+    assert dt > 0
+    assert times[-1] == pytest.approx(compiled.duration)
+    assert np.diff(times) == pytest.approx([dt] * (len(times) - 1))
@@ -0,0 +1,126 @@
+"""Shared-memory angle telemetry: create, attach, close, and name clashes."""
+
+import subprocess
+import sys
+import uuid
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pytest
+
+from arm import arm_controller
+from arm.arm_controller import ArmController, attach_angle_telemetry
+from utils.config_loader import load_config
+
+
+@pytest.fixture
+def shm_name():
+    name = f"tf_test_{uuid.uuid4().hex[:12]}"
+    yield name
+    try:
+        leftover = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    leftover.close()
+    leftover.unlink()
+
+
+def _controller(name, **telemetry):
+    cfg = load_config("config/default.yaml")
+    cfg.set("arm.telemetry.shm_name", name)
+    for key, value in telemetry.items():
+        cfg.set(f"arm.telemetry.{key}", value)
+    return ArmController(config=cfg, simulate=True)
+
+
+def _foreign_block(name, size):
+    """A block created as if by another process (not tracked by this one)."""
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def test_lifecycle(shm_name):
+    arm = _controller(shm_name)
+    assert arm._angle_shm is not None
+    assert shm_name in arm_controller._OWNED_TELEMETRY
+
+    arm.set_angles({"shoulder": 42})
+    shm, angles = attach_angle_telemetry(shm_name)
+    assert not angles.flags.writeable
+    np.testing.assert_array_equal(angles, arm._currents)
+    del angles
+    shm.close()
+
+    arm.close()
+    assert arm._angle_shm is None
+    assert shm_name not in arm_controller._OWNED_TELEMETRY
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shm_name)
+
+
+def test_second_controller_in_process_is_refused(shm_name):
+    first = _controller(shm_name)
+    second = _controller(shm_name)
+    try:
+        assert second._angle_shm is None
+        second.close()
+        # The first controller's block survives the second one closing
+        first.set_angles({"shoulder": 30})
+        shm, angles = attach_angle_telemetry(shm_name)
+        np.testing.assert_array_equal(angles, first._currents)
+        del angles
+        shm.close()
+    finally:
+        first.close()
+
+
+def test_existing_block_too_small_is_left_alone(shm_name):
+    foreign = _foreign_block(shm_name, 3)
+    try:
+        arm = _controller(shm_name)
+        assert arm._angle_shm is None
+        arm.close()
+        with pytest.raises(ValueError):
+            attach_angle_telemetry(shm_name)
+        # Still there: only the explicit opt-in may unlink it
+        shared_memory.SharedMemory(name=shm_name).close()
+    finally:
+        foreign.close()
+
+
+def test_existing_block_replaced_on_request(shm_name):
+    foreign = _foreign_block(shm_name, 3)
+    foreign.close()
+    arm = _controller(shm_name, replace_existing=True)
+    assert arm._angle_shm is not None and arm._angle_shm.size >= arm._currents.nbytes
+    arm.close()
+
+
+def test_existing_block_of_right_size_is_reused(shm_name):
+    foreign = _foreign_block(shm_name, 3 * 8)
+    foreign.close()
+    arm = _controller(shm_name)
+    assert arm._angle_shm is not None
+    arm.set_angles({"shoulder": 20})
+    arm.close()
+
+
+def test_in_process_reader_leaves_tracker_clean(shm_name):
+    # The resource tracker reports problems on stderr when the process exits
+    code = f"""
+import sys; sys.path.insert(0, ".")
+from utils.config_loader import load_config
+from arm.arm_controller import ArmController, attach_angle_telemetry
+cfg = load_config("config/default.yaml")
+cfg.set("arm.telemetry.shm_name", "{shm_name}")
+arm = ArmController(config=cfg, simulate=True)
+shm, angles = attach_angle_telemetry("{shm_name}")
+del angles
+shm.close()
+arm.close()
+"""
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr[-2000:]
+    for marker in ("Traceback", "KeyError", "leaked"):
+        assert marker not in out.stderr, out.stderr[-2000:]
@@ -0,0 +1,76 @@
+"""ConfigLoader parse memo and cross-process JSON sidecar."""
+
+import json
+import sys
+
+import pytest
+
+import utils.config_loader as config_loader
+from utils.config_loader import ConfigLoader
+
+
+@pytest.fixture(autouse=True)
+def empty_memo(monkeypatch):
+    monkeypatch.setattr(config_loader, "_parse_cache", type(config_loader._parse_cache)())
+
+
+def _block_yaml(monkeypatch):
+    """Make `import yaml` fail, proving a load did not parse YAML."""
+    monkeypatch.setitem(sys.modules, "yaml", None)
+
+
+def test_memo_skips_reparse_and_hands_out_copies(tmp_path, monkeypatch):
+    path = tmp_path / "cfg.yaml"
+    path.write_text("arm:\n  speed: 5\n  limits: {min: 0}\n")
+    first = ConfigLoader(str(path))
+    (tmp_path / ".cfg.yaml.cache.json").unlink()  # only the in-process memo left
+
+    _block_yaml(monkeypatch)
+    second = ConfigLoader(str(path))
+    assert second.config == first.config
+
+    # Edits through one loader never reach another loader or the memo
+    first.get_section("arm")["speed"] = 99
+    first.get("arm.limits")["min"] = -1
+    first.set("arm.new", 1)
+    assert second.get("arm.speed") == 5 and second.get("arm.limits.min") == 0
+    assert second.get("arm.new") is None
+    assert ConfigLoader(str(path)).get("arm.speed") == 5
+
+
+def test_sidecar_reused_across_processes(tmp_path, monkeypatch):
+    path = tmp_path / "cfg.yaml"
+    path.write_text("arm:\n  speed: 5\n")
+    expected = ConfigLoader(str(path)).config
+
+    sidecar = tmp_path / ".cfg.yaml.cache.json"
+    assert json.loads(sidecar.read_text())["config"] == expected
+
+    # A fresh process: empty memo, and PyYAML must not be needed
+    monkeypatch.setattr(config_loader, "_parse_cache", type(config_loader._parse_cache)())
+    _block_yaml(monkeypatch)
+    assert ConfigLoader(str(path)).config == expected
+
+
+def test_sidecar_ignored_after_edit(tmp_path):
+    path = tmp_path / "cfg.yaml"
+    path.write_text("arm:\n  speed: 5\n")
+    ConfigLoader(str(path))
+    path.write_text("arm:\n  speed: 6\n")
+    assert ConfigLoader(str(path)).get("arm.speed") == 6
+
+
+def test_sidecar_never_touches_real_json(tmp_path):
+    path = tmp_path / "cfg.yaml"
+    path.write_text("a: 1\n")
+    real = tmp_path / "cfg.json"
+    real.write_text('{"keep": true}')
+    ConfigLoader(str(path))
+    assert real.read_text() == '{"keep": true}'
+
+
+def test_no_sidecar_for_config_json_cannot_hold(tmp_path):
+    path = tmp_path / "cfg.yaml"
+    path.write_text("channels:\n  0: shoulder\n  1: elbow\n")  # int keys
+    assert ConfigLoader(str(path)).get_section("channels") == {0: "shoulder", 1: "elbow"}
+    assert not (tmp_path / ".cfg.yaml.cache.json").exists()
@@ -0,0 +1,212 @@
+"""PCA9685 driver write paths against a recording fake bus."""
+
+import pytest
+
+import arm.pca9685_driver as driver
+from arm.pca9685_driver import AI, MODE1, MODE2, PRESCALE, RESTART, SLEEP, PCA9685
+
+from tests.fakes import FakeI2CBus
+
+
+def _chan(ch, on, off):
+    return bytes((0x06 + 4 * ch, on & 0xFF, on >> 8, off & 0xFF, off >> 8))
+
+
+def _run(ch, pairs):
+    data = [0x06 + 4 * ch]
+    for on, off in pairs:
+        data += (on & 0xFF, on >> 8, off & 0xFF, off >> 8)
+    return bytes(data)
+
+
+@pytest.fixture
+def pca(fake_bus):
+    pwm = PCA9685(bus=fake_bus)
+    fake_bus.writes.clear()
+    return pwm
+
+
+def _sent(bus):
+    return [msgs for _, msgs in bus.writes]
+
+
+def test_setup_is_three_write_transactions():
+    bus = FakeI2CBus()
+    PCA9685(bus=bus, frequency=50)
+    assert _sent(bus) == [
+        [bytes((MODE1, AI)), bytes((MODE2, 0x04))],
+        [bytes((MODE1, AI | SLEEP)), bytes((PRESCALE, 121)), bytes((MODE1, AI))],
+        [bytes((MODE1, AI | RESTART))],
+    ]
+
+
+def test_set_pwm_is_one_block_write_and_skips_repeats(pca, fake_bus):
+    pca.set_pwm(3, 0, 300)
+    pca.set_pwm(3, 0, 300)
+    pca.set_pwm(3, 0, 301)
+    assert _sent(fake_bus) == [[_chan(3, 0, 300)], [_chan(3, 0, 301)]]
+
+
+def test_set_pwm_validates(pca, fake_bus):
+    with pytest.raises(ValueError):
+        pca.set_pwm(16, 0, 300)
+    with pytest.raises(ValueError):
+        pca.set_pwm(0, 0, 4096)
+    assert fake_bus.writes == []
+
+
+def test_failed_write_forgets_last_sent(pca, fake_bus):
+    fake_bus.fail_next = True
+    with pytest.raises(OSError):
+        pca.set_pwm(2, 0, 250)
+    pca.set_pwm(2, 0, 250)  # must be retried, not skipped as "already sent"
+    assert _sent(fake_bus) == [[_chan(2, 0, 250)]]
+
+    fake_bus.fail_next = True
+    with pytest.raises(OSError):
+        pca.set_pwm_runs([(0, [(0, 100)]), (5, [(0, 500)])])
+    pca.set_pwm_runs([(0, [(0, 100)]), (5, [(0, 500)])])
+    assert _sent(fake_bus)[-1] == [_run(0, [(0, 100)]), _run(5, [(0, 500)])]
+
+
+def test_set_pwm_runs_is_one_combined_transaction(pca, fake_bus):
+    pca.set_pwm_runs([(0, [(0, 100), (0, 110)]), (4, [(0, 400)]), (10, [(0, 1000)])])
+    assert _sent(fake_bus) == [[_run(0, [(0, 100), (0, 110)]), _run(4, [(0, 400)]), _run(10, [(0, 1000)])]]
+
+
+def test_runs_are_trimmed_at_the_ends_only(pca, fake_bus):
+    pca.set_multi_pwm(0, [(0, 100), (0, 110), (0, 120), (0, 130)])
+    fake_bus.writes.clear()
+
+    # Unchanged channels at either end are dropped
+    pca.set_multi_pwm(0, [(0, 100), (0, 111), (0, 120), (0, 130)])
+    # An unchanged channel inside the run is resent rather than splitting it
+    pca.set_multi_pwm(0, [(0, 100), (0, 112), (0, 120), (0, 131)])
+    # Nothing changed: nothing sent
+    pca.set_multi_pwm(0, [(0, 100), (0, 112), (0, 120), (0, 131)])
+    assert _sent(fake_bus) == [
+        [_run(1, [(0, 111)])],
+        [_run(1, [(0, 112), (0, 120), (0, 131)])],
+    ]
+
+
+def test_invalid_run_sends_nothing(pca, fake_bus):
+    with pytest.raises(ValueError):
+        pca.set_pwm_runs([(0, [(0, 100)]), (15, [(0, 100), (0, 100)])])
+    with pytest.raises(ValueError):
+        pca.set_pwm_runs([(0, [(0, 100)]), (3, [(0, -1)])])
+    assert fake_bus.writes == []
+
+
+def test_write_raw_and_frequency_change_forget_last_sent(pca, fake_bus):
+    pca.set_pwm(1, 0, 300)
+    pca.all_off()
+    pca.set_pwm(1, 0, 300)
+    assert _sent(fake_bus)[-1] == [_chan(1, 0, 300)]
+
+    pca.set_pwm_freq(60)
+    fake_bus.writes.clear()
+    pca.set_pwm(1, 0, 300)
+    assert _sent(fake_bus) == [[_chan(1, 0, 300)]]
+
+
+def test_transaction_flushes_once_on_exit(pca, fake_bus):
+    with pca.transaction():
+        pca.set_pwm(3, 0, 300)
+        pca.set_pwm(1, 0, 100)
+        pca.set_pwm(2, 0, 200)
+        pca.set_pwm(7, 0, 700)
+        with pca.transaction():  # nested: joins the outer one
+            pca.set_pwm(7, 0, 701)
+        pca.set_multi_pwm(9, [(0, 900), (0, 1000)])
+        assert fake_bus.writes == []
+    assert _sent(fake_bus) == [
+        [_run(1, [(0, 100), (0, 200), (0, 300)]), _run(7, [(0, 701)]), _run(9, [(0, 900), (0, 1000)])]
+    ]
+
+
+def test_transaction_last_write_wins_and_skips_no_ops(pca, fake_bus):
+    pca.set_pwm(1, 0, 100)
+    fake_bus.writes.clear()
+    with pca.transaction():
+        pca.set_pwm(1, 0, 5)
+        pca.set_pwm(1, 0, 100)  # back to what the chip already holds
+    assert fake_bus.writes == []
+
+
+def test_aborted_transaction_sends_nothing(pca, fake_bus):
+    with pytest.raises(KeyError):
+        with pca.transaction():
+            pca.set_pwm(4, 0, 1)
+            raise KeyError("abort")
+    assert fake_bus.writes == []
+    assert pca._pending is None
+    pca.set_pwm(4, 0, 1)  # not mistaken for already sent
+    assert _sent(fake_bus) == [[_chan(4, 0, 1)]]
+
+
+def test_caller_owned_bus_stays_open(fake_bus):
+    pwm = PCA9685(bus=fake_bus)
+    pwm.close()
+    assert not fake_bus.closed
+
+
+# ---- shared (bus, address) connections ----
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Route PCA9685's own bus opening to fake buses; returns the list of them."""
+    buses = []
+
+    def open_bus(self, i2c_bus):
+        self._raw_io = True
+        bus = FakeI2CBus()
+        buses.append(bus)
+        return bus
+
+    monkeypatch.setattr(PCA9685, "_open_bus", open_bus)
+    monkeypatch.setattr(PCA9685, "_check_bus_clock", lambda self, i2c_bus, wanted_hz: None)
+    monkeypatch.setattr(driver, "FAST_I2C_AVAILABLE", True)
+    monkeypatch.setattr(driver, "_PCA_CACHE", {})
+    return buses
+
+
+def test_shared_connection_refcounting(opened):
+    a = PCA9685()
+    b = PCA9685()
+    assert len(opened) == 1 and a.bus is b.bus
+    assert driver._PCA_CACHE[(1, 0x40)].refs == 2
+
+    a.set_pwm(0, 0, 300)
+    b.set_pwm(0, 0, 300)  # shared last-sent cache: already on the chip
+    assert len(opened[0].writes) == 4  # 3 setup + 1
+
+    a.close()
+    assert a.bus is None and not opened[0].closed
+    b.set_pwm(0, 0, 310)  # the remaining holder still drives the chip
+    assert opened[0].writes[-1][1] == [_chan(0, 0, 310)]
+
+    b.close()
+    assert opened[0].closed and (1, 0x40) not in driver._PCA_CACHE
+
+    c = PCA9685()
+    assert len(opened) == 2 and c.bus is opened[1]
+    c.close()
+
+
+def test_shared_connection_refuses_conflicting_frequency(opened):
+    a = PCA9685(frequency=50)
+    b = PCA9685(frequency=50)
+    with pytest.raises(ValueError):
+        PCA9685(frequency=60)
+    with pytest.raises(ValueError):
+        a.set_pwm_freq(60)
+    assert a.frequency == b.frequency == 50
+    a.set_pwm_freq(50)  # same frequency is fine
+
+    b.close()
+    a.set_pwm_freq(60)  # sole holder may change it
+    d = PCA9685(frequency=60)
+    assert d.bus is a.bus and len(opened) == 1
+    a.close()
+    d.close()
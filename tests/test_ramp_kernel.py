@@ -0,0 +1,26 @@
+"""Numba ramp kernel must match the NumPy fallback, upward and downward."""
+
+import numpy as np
+import pytest
+
+from arm import _ramp_numba
+
+
+def _ramp(fn, start, end, n_steps):
+    out = np.empty((n_steps, len(start)), dtype=np.uint16)
+    fn(np.array(start, dtype=np.uint16), np.array(end, dtype=np.uint16), n_steps, out)
+    return out
+
+
+def test_numpy_ramp_downward():
+    rows = _ramp(_ramp_numba._ramp_ticks_numpy, [400], [300], 5)
+    assert rows[:, 0].tolist() == [390, 365, 335, 310, 300]
+
+
+@pytest.mark.skipif(not _ramp_numba.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("n_steps", [1, 5, 37])
+def test_numba_matches_numpy(n_steps):
+    start = [400, 300, 102, 512, 4095, 0]
+    end = [300, 400, 512, 102, 0, 4095]
+    expected = _ramp(_ramp_numba._ramp_ticks_numpy, start, end, n_steps)
+    np.testing.assert_array_equal(_ramp(_ramp_numba.ramp_ticks, start, end, n_steps), expected)
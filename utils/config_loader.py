@@ -4,17 +4,101 @@ Configuration loader for Trashformer robot.
 Loads YAML configuration and supports:
 - dot-notation access (e.g., 'arm.pwm_frequency')
 - section access (e.g., get_section('arm'))
+
+Parsed files are memoized on (path, content hash), so repeated loads of an
+unchanged config skip the YAML parse. Each loader gets its own deep copy of
+the memoized dict, so edits through one loader (set(), or in place on a
+section from get()) never reach another loader or the memo.
+
+Across processes the parsed dict is cached as JSON next to the YAML
+(config/default.yaml -> config/.default.yaml.cache.json), tagged with the
+content hash it was built from, so a restart with an unchanged config skips
+PyYAML entirely.
 """
 
 from __future__ import annotations
 
-import yaml
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PARSE_CACHE_SIZE = 16
+_parse_cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+
+
+def _read_json_cache(cache_file: Path, digest: str) -> Optional[Dict[str, Any]]:
+    """Config from the JSON sidecar if it was written for this exact YAML content."""
+    if not cache_file.exists():
+        return None
+    data = json.loads(cache_file.read_bytes())
+    if not isinstance(data, dict) or data.get("digest") != digest:
+        return None
+    config = data.get("config")
+    return config if isinstance(config, dict) else None
+
+
+def _write_json_cache(cache_file: Path, digest: str, config: Dict[str, Any]) -> None:
+    """Write the JSON sidecar atomically; skipped if JSON can't hold `config` exactly."""
+    try:
+        payload = json.dumps({"digest": digest, "config": config}, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return  # e.g. YAML dates
+    if json.loads(payload)["config"] != config:
+        return  # e.g. non-string keys or tuples, which JSON would change
+    tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _parse_cached(path: Path) -> Dict[str, Any]:
+    """
+    Parse `path`, reusing an earlier result if the file content is unchanged.
+    The result is the memo's own dict: copy it before handing it out.
+    """
+    raw = path.read_bytes()
+    key = (str(path.resolve()), hashlib.blake2b(raw, digest_size=16).digest())
+    data = _parse_cache.get(key)
+    if data is not None:
+        _parse_cache.move_to_end(key)
+        return data
+
+    # Dedicated name, so a real <name>.json next to the YAML is never overwritten
+    cache_file = path.with_name(f".{path.name}.cache.json")
+    digest = key[1].hex()
+    try:
+        data = _read_json_cache(cache_file, digest)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+    if data is None:
+        # Imported on first parse rather than with this module (import cost on
+        # the Pi). libyaml's C parser when PyYAML was built against it.
+        import yaml
+
+        data = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        if not isinstance(data, dict):
+            raise ValueError("Config YAML did not parse into a dictionary.")
+        _write_json_cache(cache_file, digest, data)
+
+    _parse_cache[key] = data
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+    return data
+
 
 class ConfigLoader:
     def __init__(self, config_path: Optional[str] = None):
@@ -31,11 +115,7 @@ class ConfigLoader:
 
     def load(self) -> Dict[str, Any]:
         try:
-            with self.config_path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            if not isinstance(data, dict):
-                raise ValueError("Config YAML did not parse into a dictionary.")
-            self.config = data
+            self.config = copy.deepcopy(_parse_cached(self.config_path))
             logger.info(f"Loaded configuration from {self.config_path}")
             return self.config
         except Exception as e:
@@ -71,6 +151,8 @@ class ConfigLoader:
     def save(self, path: Optional[str] = None) -> None:
         save_path = Path(path) if path else self.config_path
         try:
+            import yaml
+
             with save_path.open("w", encoding="utf-8") as f:
                 yaml.dump(self.config, f, default_flow_style=False, indent=2)
             logger.info(f"Saved configuration to {save_path}")